@@ -105,6 +105,7 @@ def main() -> None:
         settings_provider=settings_provider,
         update_settings=update_settings,
         refresh_callback=refresh_activity,
+        bind_notification_wakeup=shared_state.set_notification_listener,
     )
 
 
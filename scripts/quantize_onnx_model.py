@@ -0,0 +1,52 @@
+"""离线量化 ONNX 姿态模型，生成 INT8（及可选 FP16）版本。"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from pathlib import Path
+
+from upclock.adapters.vision.posture_onnx import FP16_MODEL_SUFFIX, INT8_MODEL_SUFFIX
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="[%(asctime)s][%(levelname)s] %(name)s: %(message)s")
+
+
+def quantize_int8(source: Path) -> Path:
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    target = source.with_name(f"{source.stem}{INT8_MODEL_SUFFIX}{source.suffix}")
+    quantize_dynamic(str(source), str(target), weight_type=QuantType.QInt8)
+    return target
+
+
+def convert_fp16(source: Path) -> Path:
+    try:
+        import onnx
+        from onnxconverter_common import float16
+    except ImportError as exc:
+        raise SystemExit("生成 FP16 模型需要安装 onnx 与 onnxconverter-common") from exc
+
+    target = source.with_name(f"{source.stem}{FP16_MODEL_SUFFIX}{source.suffix}")
+    model = float16.convert_float_to_float16(onnx.load(str(source)), keep_io_types=True)
+    onnx.save(model, str(target))
+    return target
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("model", type=Path, help="原始 FP32 ONNX 模型路径")
+    parser.add_argument("--fp16", action="store_true", help="额外生成供 CoreML 后端使用的 FP16 模型")
+    args = parser.parse_args()
+
+    source = args.model.expanduser().resolve()
+    if not source.exists():
+        raise SystemExit(f"找不到模型文件: {source}")
+
+    logger.info("已生成 INT8 模型: %s", quantize_int8(source))
+    if args.fp16:
+        logger.info("已生成 FP16 模型: %s", convert_fp16(source))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 import datetime as dt
-from typing import Dict, Union
+from typing import Any, Dict, Union
 
 from upclock.core.signal_buffer import SignalBuffer, SignalRecord
 
@@ -24,3 +25,12 @@ class InputAdapter(abc.ABC):
 
         record = SignalRecord(timestamp=dt.datetime.utcnow(), values=values)
         self._buffer.append(record)
+
+
+def cancel_task_threadsafe(task: "asyncio.Task[Any]") -> None:
+    """从任意线程取消任务，便于在线程池中并行执行适配器的 stop()。"""
+
+    loop = task.get_loop()
+    if loop.is_closed():
+        return
+    loop.call_soon_threadsafe(task.cancel)
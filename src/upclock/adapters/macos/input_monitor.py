@@ -3,35 +3,51 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import threading
 from typing import Dict, Optional
 
-import Quartz
-
-from upclock.adapters.base import InputAdapter
+from upclock.adapters.base import InputAdapter, cancel_task_threadsafe
 
 logger = logging.getLogger(__name__)
 
-_KEYBOARD_EVENT_TYPES = {
-    Quartz.kCGEventKeyDown,
-    Quartz.kCGEventKeyUp,
-    Quartz.kCGEventFlagsChanged,
-}
-_MOUSE_EVENT_TYPES = {
-    Quartz.kCGEventMouseMoved,
-    Quartz.kCGEventLeftMouseDown,
-    Quartz.kCGEventLeftMouseUp,
-    Quartz.kCGEventRightMouseDown,
-    Quartz.kCGEventRightMouseUp,
-    Quartz.kCGEventOtherMouseDown,
-    Quartz.kCGEventOtherMouseUp,
-    Quartz.kCGEventLeftMouseDragged,
-    Quartz.kCGEventRightMouseDragged,
-    Quartz.kCGEventOtherMouseDragged,
-}
-_SCROLL_EVENT_TYPES = {Quartz.kCGEventScrollWheel}
-_ALL_EVENT_TYPES = _KEYBOARD_EVENT_TYPES | _MOUSE_EVENT_TYPES | _SCROLL_EVENT_TYPES
+_KEYBOARD_SLOT, _MOUSE_SLOT, _SCROLL_SLOT = range(3)
+
+
+@functools.lru_cache(maxsize=1)
+def _quartz():  # type: ignore[no-untyped-def]
+    """首次创建监控器时才导入 Quartz，避免拖慢包导入与应用启动。"""
+
+    import Quartz
+
+    return Quartz
+
+
+@functools.lru_cache(maxsize=1)
+def _event_slot_table() -> Dict[int, int]:
+    """事件类型 -> 计数槽位，回调中一次查表即可，无需逐个集合判断。"""
+
+    Quartz = _quartz()
+    keyboard = (Quartz.kCGEventKeyDown, Quartz.kCGEventKeyUp, Quartz.kCGEventFlagsChanged)
+    mouse = (
+        Quartz.kCGEventMouseMoved,
+        Quartz.kCGEventLeftMouseDown,
+        Quartz.kCGEventLeftMouseUp,
+        Quartz.kCGEventRightMouseDown,
+        Quartz.kCGEventRightMouseUp,
+        Quartz.kCGEventOtherMouseDown,
+        Quartz.kCGEventOtherMouseUp,
+        Quartz.kCGEventLeftMouseDragged,
+        Quartz.kCGEventRightMouseDragged,
+        Quartz.kCGEventOtherMouseDragged,
+    )
+    scroll = (Quartz.kCGEventScrollWheel,)
+    return {
+        **{event_type: _KEYBOARD_SLOT for event_type in keyboard},
+        **{event_type: _MOUSE_SLOT for event_type in mouse},
+        **{event_type: _SCROLL_SLOT for event_type in scroll},
+    }
 
 
 class MacOSInputMonitor(InputAdapter):
@@ -44,9 +60,8 @@ class MacOSInputMonitor(InputAdapter):
         self._event_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._lock = threading.Lock()
-        self._keyboard_events = 0
-        self._mouse_events = 0
-        self._scroll_events = 0
+        self._counts = [0, 0, 0]
+        self._event_slot = _event_slot_table()
 
     async def start(self) -> None:
         """启动事件捕获与指标汇总。"""
@@ -77,7 +92,7 @@ class MacOSInputMonitor(InputAdapter):
 
         self._stop_event.set()
         if self._task is not None:
-            self._task.cancel()
+            cancel_task_threadsafe(self._task)
             self._task = None
         if self._event_thread is not None:
             self._event_thread.join(timeout=1.0)
@@ -91,9 +106,11 @@ class MacOSInputMonitor(InputAdapter):
             self._handle_event(int(type_))
             return event
 
+        Quartz = _quartz()
+
         def _run_loop() -> None:
             event_mask = 0
-            for event_type in _ALL_EVENT_TYPES:
+            for event_type in self._event_slot:
                 event_mask |= Quartz.CGEventMaskBit(event_type)
 
             tap = Quartz.CGEventTapCreate(
@@ -127,22 +144,16 @@ class MacOSInputMonitor(InputAdapter):
         self._event_thread.start()
 
     def _handle_event(self, event_type: int) -> None:
+        slot = self._event_slot.get(event_type)
+        if slot is None:
+            return
         with self._lock:
-            if event_type in _KEYBOARD_EVENT_TYPES:
-                self._keyboard_events += 1
-            elif event_type in _MOUSE_EVENT_TYPES:
-                self._mouse_events += 1
-            elif event_type in _SCROLL_EVENT_TYPES:
-                self._scroll_events += 1
+            self._counts[slot] += 1
 
     def _drain_metrics(self) -> Dict[str, float]:
         with self._lock:
-            keyboard = self._keyboard_events
-            mouse = self._mouse_events
-            scroll = self._scroll_events
-            self._keyboard_events = 0
-            self._mouse_events = 0
-            self._scroll_events = 0
+            keyboard, mouse, scroll = self._counts
+            self._counts = [0, 0, 0]
 
         total = keyboard + mouse + scroll
         return {
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from typing import Iterable, List, Optional
 
 try:  # pragma: no cover - 平台判定
@@ -12,7 +14,7 @@ try:  # pragma: no cover - 平台判定
 except ImportError:  # pragma: no cover - 非 macOS 环境
     AppKit = None  # type: ignore
 
-from upclock.adapters.base import InputAdapter
+from upclock.adapters.base import InputAdapter, cancel_task_threadsafe
 from upclock.config import WindowCategory
 
 logger = logging.getLogger(__name__)
@@ -25,12 +27,24 @@ class CategoryRule:
     name: str
     weight: float
     patterns: List[str]
+    _needles: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _regex: Optional[re.Pattern[str]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # 预先转小写并剔除空模式，所有模式编译成一个交替正则，一次扫描完成匹配
+        self._needles = tuple(pattern.lower() for pattern in self.patterns if pattern)
+        self._regex = _compile_needles(self._needles)
 
     @classmethod
     def from_category(cls, category: WindowCategory) -> "CategoryRule":
         return cls(name=category.name, weight=category.weight, patterns=list(category.patterns))
 
 
+def _compile_needles(needles: Iterable[str]) -> Optional[re.Pattern[str]]:
+    escaped = [re.escape(needle) for needle in needles]
+    return re.compile("|".join(escaped)) if escaped else None
+
+
 _DEFAULT_RULES: List[CategoryRule] = [
     CategoryRule(name="work", weight=1.0, patterns=["code", "terminal", "xcode", "notion", "google docs"]),
     CategoryRule(name="meeting", weight=0.9, patterns=["zoom", "meet", "teams"]),
@@ -57,6 +71,10 @@ class MacOSWindowMonitor(InputAdapter):
             else list(_DEFAULT_RULES)
         )
         self._last_info: dict[str, str | float] = {}
+        # 全部规则的模式合成一个预筛正则：未命中任何模式时可直接判定为 neutral
+        self._any_rule_regex = _compile_needles(needle for rule in self._rules for needle in rule._needles)
+        # 前台应用变化远少于轮询次数，规则在构造后不变，可按 (bundle_id, app_name) 缓存结果
+        self._match_rule_cached = functools.lru_cache(maxsize=256)(self._match_rule_uncached)
 
     async def start(self) -> None:
         if self._task is not None:
@@ -76,7 +94,7 @@ class MacOSWindowMonitor(InputAdapter):
 
     def stop(self) -> None:
         if self._task is not None:
-            self._task.cancel()
+            cancel_task_threadsafe(self._task)
             self._task = None
 
     def latest_info(self) -> dict[str, str | float]:
@@ -110,12 +128,17 @@ class MacOSWindowMonitor(InputAdapter):
         return metrics
 
     def _match_rule(self, bundle_id: str, app_name: str) -> CategoryRule:
-        target_values = [bundle_id.lower(), app_name.lower()]
+        return self._match_rule_cached(bundle_id, app_name)
+
+    def _match_rule_uncached(self, bundle_id: str, app_name: str) -> CategoryRule:
+        if self._any_rule_regex is None:
+            return _NEUTRAL_RULE
+        # 以换行分隔两个字段，避免模式跨越 bundle_id 与 app_name 的边界命中
+        haystack = f"{bundle_id}\n{app_name}".lower()
+        if self._any_rule_regex.search(haystack) is None:
+            return _NEUTRAL_RULE
+        # 预筛命中后仍按规则顺序逐个判断，保持原有的优先级
         for rule in self._rules:
-            for pattern in rule.patterns:
-                pattern_lower = pattern.lower()
-                if not pattern_lower:
-                    continue
-                if any(pattern_lower in value for value in target_values):
-                    return rule
+            if rule._regex is not None and rule._regex.search(haystack) is not None:
+                return rule
         return _NEUTRAL_RULE
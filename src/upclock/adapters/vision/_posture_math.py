@@ -0,0 +1,68 @@
+"""躯干姿态评分的数值内核。
+
+安装 numba 时编译为本地代码，未安装时以纯 Python 运行，结果一致。
+"""
+
+from __future__ import annotations
+
+import math
+
+try:  # pragma: no cover - numba 为可选加速
+    from numba import njit  # type: ignore
+except ImportError:  # pragma: no cover - 未安装 numba 时退回纯 Python
+    njit = None  # type: ignore
+
+# posture_state 编码，与 _posture_kernel 的返回值对应
+POSTURE_STATES = ("untracked", "upright", "slouch", "uncertain")
+_UNTRACKED, _UPRIGHT, _SLOUCH, _UNCERTAIN = range(4)
+
+
+def _posture_kernel(flat, cfg):  # type: ignore[no-untyped-def]
+    """计算躯干姿态。
+
+    ``flat`` 为 (4, 4) 关键点按行展开的 16 个数（行序见 TORSO_KEYPOINTS，列为 x, y, z, visibility）；
+    ``cfg`` 为 (min_landmark_confidence, depth_tolerance, shoulder_tilt_tolerance,
+    upright_threshold, slouch_threshold, presence_threshold)。
+    返回 (状态编码, presence, confidence, 未取整的 posture_score)。
+    """
+
+    torso_x = (flat[0] + flat[4]) / 2.0 - (flat[8] + flat[12]) / 2.0
+    torso_y = (flat[1] + flat[5]) / 2.0 - (flat[9] + flat[13]) / 2.0
+    torso_z = (flat[2] + flat[6]) / 2.0 - (flat[10] + flat[14]) / 2.0
+    avg_visibility = (flat[3] + flat[7] + flat[11] + flat[15]) / 4.0
+
+    if avg_visibility < cfg[0]:
+        return _UNTRACKED, False, avg_visibility, 0.0
+
+    torso_norm = math.hypot(torso_x, torso_y)
+    if torso_norm < 1e-5:
+        posture_score = 0.0
+    else:
+        # 与竖直向上方向 (0, -1) 的夹角余弦，图像坐标系向上为负
+        posture_score = max(0.0, min(1.0, -torso_y / torso_norm))
+
+    depth_penalty = min(0.5, abs(torso_z) / max(cfg[1], 1e-3)) * 0.3
+    posture_score = max(0.0, posture_score - depth_penalty)
+
+    shoulder_tilt = abs(flat[1] - flat[5])
+    tilt_penalty = min(0.4, shoulder_tilt / max(cfg[2], 1e-3)) * 0.2
+    posture_score = max(0.0, posture_score - tilt_penalty)
+
+    if posture_score >= cfg[3]:
+        state = _UPRIGHT
+    elif posture_score <= cfg[4]:
+        state = _SLOUCH
+    else:
+        state = _UNCERTAIN
+
+    confidence = max(0.0, min(1.0, avg_visibility))
+    return state, avg_visibility >= cfg[5], confidence, posture_score
+
+
+if njit is not None:  # pragma: no cover - 依赖 numba
+    posture_kernel = njit(cache=True)(_posture_kernel)
+    KERNEL_ACCEPTS_ARRAY = True
+else:
+    posture_kernel = _posture_kernel
+    # 纯 Python 下逐元素访问 list 比访问 ndarray 快得多
+    KERNEL_ACCEPTS_ARRAY = False
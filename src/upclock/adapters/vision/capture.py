@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 from dataclasses import dataclass
 from typing import AsyncIterator, Optional
 
@@ -18,6 +19,9 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+_FRAME_WAIT_SECONDS = 1.0
+_READER_JOIN_TIMEOUT = 1.0
+
 
 @dataclass
 class Frame:
@@ -28,13 +32,59 @@ class Frame:
     timestamp: float
 
 
+class LatestFrameSlot:
+    """单槽帧缓存：读取线程持续 grab 丢弃旧帧，仅在消费者 take 请求时才 retrieve 解码最新一帧。"""
+
+    __slots__ = ("_frame", "_cond", "_wanted", "_closed")
+
+    def __init__(self) -> None:
+        self._frame: Optional[np.ndarray] = None
+        self._cond = threading.Condition()
+        self._wanted = False
+        self._closed = False
+
+    @property
+    def wanted(self) -> bool:
+        return self._wanted
+
+    def put(self, frame: np.ndarray) -> None:
+        with self._cond:
+            self._frame = frame
+            self._wanted = False
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def take(self, timeout: float) -> Optional[np.ndarray]:
+        with self._cond:
+            # 槽里残留的是上一次请求之后解码的帧，已经过期
+            self._frame = None
+            if not self._closed:
+                self._wanted = True
+                self._cond.wait_for(lambda: self._frame is not None or self._closed, timeout)
+            frame, self._frame = self._frame, None
+            self._wanted = False
+        return frame
+
+
 class CameraCapture:
-    """摄像头帧捕获，支持异步迭代。"""
+    """摄像头帧捕获，支持异步迭代。
+
+    后台线程持续 grab 清空驱动队列，迭代请求时才解码最新一帧，
+    推理慢于采集时既不积压过期帧，也不为丢弃的帧付出解码开销。
+    """
 
     def __init__(self, device_index: int = 0, frame_size: int = 256) -> None:
         self.device_index = device_index
         self.frame_size = frame_size
         self._capture: Optional[cv2.VideoCapture] = None
+        self._slot = LatestFrameSlot()
+        self._reader: Optional[threading.Thread] = None
+        self._stop_reading = threading.Event()
+        self._read_failed = threading.Event()
 
     async def __aenter__(self) -> "CameraCapture":
         loop = asyncio.get_running_loop()
@@ -46,14 +96,60 @@ class CameraCapture:
         await loop.run_in_executor(None, self._release)
 
     def _open(self) -> None:
-        self._capture = cv2.VideoCapture(self.device_index)
-        if not self._capture.isOpened():
+        capture = cv2.VideoCapture(self.device_index)
+        if not capture.isOpened():
+            capture.release()
             raise RuntimeError("无法打开摄像头，请检查权限或设备连接")
+        # 驱动侧队列也只保留一帧，避免读到排队中的旧画面
+        capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        # 每个读取线程独占自己的停止标记、失败标记与帧槽，重连后旧线程即便迟迟未退出也影响不到新线程
+        stop, failed, slot = threading.Event(), threading.Event(), LatestFrameSlot()
+        reader = threading.Thread(
+            target=self._read_loop,
+            args=(capture, stop, failed, slot),
+            name="upclock-camera-reader",
+            daemon=True,
+        )
+        self._capture, self._reader = capture, reader
+        self._stop_reading, self._read_failed, self._slot = stop, failed, slot
+        reader.start()
+
+    @staticmethod
+    def _read_loop(
+        capture: cv2.VideoCapture,
+        stop: threading.Event,
+        failed: threading.Event,
+        slot: LatestFrameSlot,
+    ) -> None:
+        try:
+            while not stop.is_set():
+                if not capture.grab():
+                    return
+                if slot.wanted:
+                    ret, frame = capture.retrieve()
+                    if not ret:
+                        return
+                    slot.put(frame)
+        finally:
+            if not stop.is_set():
+                failed.set()
+            # 设备由读取线程自己释放，保证不会在 grab() 阻塞期间被其他线程释放
+            capture.release()
+            slot.close()
 
     def _release(self) -> None:
-        if self._capture is not None:
-            self._capture.release()
-            self._capture = None
+        self._stop_reading.set()
+        reader = self._reader
+        self._reader = None
+        self._capture = None
+        if reader is not None:
+            reader.join(timeout=_READER_JOIN_TIMEOUT)
+            if reader.is_alive():
+                logger.warning("摄像头读取线程未及时退出，设备将在其退出时释放")
+
+    def _reopen(self) -> None:
+        self._release()
+        self._open()
 
     async def frames(self) -> AsyncIterator[Frame]:
         if self._capture is None:
@@ -61,10 +157,11 @@ class CameraCapture:
 
         loop = asyncio.get_running_loop()
         while True:
-            ret, frame = await loop.run_in_executor(None, self._capture.read)
-            if not ret:
-                logger.warning("摄像头读取失败，尝试重连")
-                await loop.run_in_executor(None, self._open)
+            frame = await loop.run_in_executor(None, self._slot.take, _FRAME_WAIT_SECONDS)
+            if frame is None:
+                if self._read_failed.is_set():
+                    logger.warning("摄像头读取失败，尝试重连")
+                    await loop.run_in_executor(None, self._reopen)
                 continue
 
             rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
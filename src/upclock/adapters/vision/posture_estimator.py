@@ -12,8 +12,13 @@ try:  # pragma: no cover - numpy 为可选依赖
 except ImportError:  # pragma: no cover - 缺少 numpy 时允许降级
     np = None  # type: ignore[assignment]
 
+from ._posture_math import KERNEL_ACCEPTS_ARRAY, POSTURE_STATES, posture_kernel
+
 logger = logging.getLogger(__name__)
 
+# 计算躯干姿态所需的关键点，顺序与 `compute_posture_from_array` 的行一致
+TORSO_KEYPOINTS = ("left_shoulder", "right_shoulder", "left_hip", "right_hip")
+
 try:  # pragma: no cover - 依赖可选组件
     import mediapipe as mp  # type: ignore
 except ImportError:  # pragma: no cover - 未安装 mediapipe 时允许降级
@@ -97,91 +102,58 @@ class MediaPipePoseEstimator(PostureEstimator):
         self._pose.close()
 
     def _parse_landmarks(self, landmarks) -> Optional[PostureEstimate]:  # type: ignore[no-untyped-def]
-        keypoints = {lm.name.lower(): landmarks[lm.value] for lm in mp.solutions.pose.PoseLandmark}  # type: ignore[attr-defined]
+        pose_landmark = mp.solutions.pose.PoseLandmark  # type: ignore[attr-defined]
         try:
-            return self.compute_posture_from_keypoints(
-                keypoints,
-                config=self._config,
-            )
-        except ValueError as exc:  # pragma: no cover - 坐标缺失的异常路径
+            torso = [landmarks[pose_landmark[name.upper()].value] for name in TORSO_KEYPOINTS]
+        except (IndexError, KeyError) as exc:  # pragma: no cover - 坐标缺失的异常路径
             logger.debug("姿态估计关键点不足: %s", exc)
             return None
+        points = np.array([(lm.x, lm.y, lm.z, lm.visibility) for lm in torso], dtype=np.float64)
+        return self.compute_posture_from_array(points, config=self._config)
 
     @staticmethod
     def compute_posture_from_keypoints(
         keypoints: dict[str, object],
         config: PostureEstimationConfig,
     ) -> PostureEstimate:
-        required = [
-            "left_shoulder",
-            "right_shoulder",
-            "left_hip",
-            "right_hip",
-        ]
-        points = {}
-        for name in required:
-            landmark = keypoints.get(name)
-            if landmark is None:
+        rows = []
+        for name in TORSO_KEYPOINTS:
+            lm = keypoints.get(name)
+            if lm is None:
                 raise ValueError(f"缺少关键点 {name}")
-            points[name] = landmark
-
-        def _vec(name: str) -> np.ndarray:
-            lm = points[name]
-            return np.array([lm.x, lm.y, lm.z, lm.visibility])  # type: ignore[attr-defined]
-
-        left_shoulder = _vec("left_shoulder")
-        right_shoulder = _vec("right_shoulder")
-        left_hip = _vec("left_hip")
-        right_hip = _vec("right_hip")
-
-        shoulder_center = (left_shoulder[:3] + right_shoulder[:3]) / 2.0
-        hip_center = (left_hip[:3] + right_hip[:3]) / 2.0
-        torso_vector = shoulder_center - hip_center
-
-        torso_xy = torso_vector[:2]
-        torso_norm = np.linalg.norm(torso_xy)
-        if torso_norm < 1e-5:
-            posture_score = 0.0
-        else:
-            vertical = np.array([0.0, -1.0])  # 图像坐标系向上为负
-            cos_theta = float(np.dot(torso_xy, vertical) / (torso_norm * np.linalg.norm(vertical)))
-            posture_score = max(0.0, min(1.0, cos_theta))
-
-        avg_visibility = float(
-            np.mean([left_shoulder[3], right_shoulder[3], left_hip[3], right_hip[3]])
+            rows.append((lm.x, lm.y, lm.z, lm.visibility))  # type: ignore[attr-defined]
+        return MediaPipePoseEstimator.compute_posture_from_array(
+            np.array(rows, dtype=np.float64),
+            config=config,
         )
 
-        if avg_visibility < config.min_landmark_confidence:
-            return PostureEstimate(
-                presence=False,
-                confidence=avg_visibility,
-                posture_score=0.0,
-                posture_state="untracked",
-            )
-
-        depth_delta = float(abs((shoulder_center[2] - hip_center[2])))
-        depth_penalty = min(0.5, depth_delta / max(config.depth_tolerance, 1e-3)) * 0.3
-        posture_score = max(0.0, posture_score - depth_penalty)
-
-        shoulder_tilt = abs(left_shoulder[1] - right_shoulder[1])
-        tilt_penalty = min(0.4, shoulder_tilt / max(config.shoulder_tilt_tolerance, 1e-3)) * 0.2
-        posture_score = max(0.0, posture_score - tilt_penalty)
-
-        if posture_score >= config.upright_threshold:
-            posture_state = "upright"
-        elif posture_score <= config.slouch_threshold:
-            posture_state = "slouch"
-        else:
-            posture_state = "uncertain"
-
-        presence = avg_visibility >= config.presence_threshold
-        confidence = max(0.0, min(1.0, avg_visibility))
-
+    @staticmethod
+    def compute_posture_from_array(
+        points: np.ndarray,
+        config: PostureEstimationConfig,
+    ) -> PostureEstimate:
+        """根据形如 (4, 4) 的关键点数组计算姿态。
+
+        行依次为 TORSO_KEYPOINTS，列为 (x, y, z, visibility)。
+        """
+
+        flat = np.ascontiguousarray(points, dtype=np.float64).reshape(16)
+        cfg = (
+            float(config.min_landmark_confidence),
+            float(config.depth_tolerance),
+            float(config.shoulder_tilt_tolerance),
+            float(config.upright_threshold),
+            float(config.slouch_threshold),
+            float(config.presence_threshold),
+        )
+        state, presence, confidence, posture_score = posture_kernel(
+            flat if KERNEL_ACCEPTS_ARRAY else flat.tolist(), cfg
+        )
         return PostureEstimate(
-            presence=presence,
-            confidence=confidence,
-            posture_score=round(posture_score, 4),
-            posture_state=posture_state,
+            presence=bool(presence),
+            confidence=float(confidence),
+            posture_score=round(float(posture_score), 4),
+            posture_state=POSTURE_STATES[state],
         )
 
 
@@ -4,19 +4,12 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
 import numpy as np
 
-try:  # pragma: no cover - 可选依赖
-    import onnxruntime as ort  # type: ignore
-except Exception as exc:  # pragma: no cover - 未安装 onnxruntime
-    ort = None  # type: ignore
-    _onnx_error = exc
-else:  # pragma: no cover
-    _onnx_error = None
-
 try:  # pragma: no cover - vision 依赖
     import cv2  # type: ignore
 except Exception as exc:  # pragma: no cover
@@ -30,11 +23,26 @@ from .posture_estimator import (
     PostureEstimate,
     PostureEstimationConfig,
     PostureEstimator,
+    TORSO_KEYPOINTS,
 )
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _load_onnxruntime():  # type: ignore[no-untyped-def]
+    """首次构建估计器时才导入 onnxruntime，避免拖慢启动。"""
+
+    import onnxruntime  # type: ignore
+
+    return onnxruntime
+
+
+# 量化模型与原模型放在同一目录，文件名追加后缀，见 scripts/quantize_onnx_model.py
+INT8_MODEL_SUFFIX = "_int8"
+FP16_MODEL_SUFFIX = "_fp16"
+
+
 @dataclass(frozen=True)
 class OnnxModelSpec:
     """描述 ONNX 姿态模型的输入输出规范。"""
@@ -87,12 +95,30 @@ def _known_model_specs() -> Dict[str, OnnxModelSpec]:
     }
 
 
-@dataclass
-class _KeyPoint:
-    x: float
-    y: float
-    z: float
-    visibility: float
+@lru_cache(maxsize=None)
+def _normalization(spec: OnnxModelSpec) -> tuple[np.ndarray, np.ndarray]:
+    """返回模型输入的均值与标准差数组。"""
+
+    return np.asarray(spec.mean, dtype=np.float32), np.asarray(spec.std, dtype=np.float32)
+
+
+def _input_shape(spec: OnnxModelSpec) -> tuple[int, int, int, int]:
+    width, height = spec.input_size
+    if spec.input_layout == "nhwc":
+        return (1, height, width, 3)
+    if spec.input_layout == "nchw":
+        return (1, 3, height, width)
+    raise ValueError(f"不支持的输入布局: {spec.input_layout}")
+
+
+@lru_cache(maxsize=None)
+def _torso_indices(spec: OnnxModelSpec) -> list[int]:
+    """返回躯干关键点在模型输出中的行号。"""
+
+    try:
+        return [spec.keypoint_names.index(name) for name in TORSO_KEYPOINTS]
+    except ValueError as exc:
+        raise ValueError(f"模型 {spec.name} 缺少躯干关键点") from exc
 
 
 class ONNXPoseEstimator(PostureEstimator):
@@ -102,6 +128,10 @@ class ONNXPoseEstimator(PostureEstimator):
     也支持自定义输出为 `[presence_confidence, posture_score]` 的轻量模型。
     """
 
+    _input_buffer: Optional[np.ndarray] = None
+    _output_buffer: Optional[np.ndarray] = None
+    _io_binding = None
+
     def __init__(
         self,
         config: Optional[PostureEstimationConfig] = None,
@@ -110,30 +140,63 @@ class ONNXPoseEstimator(PostureEstimator):
         providers: Optional[list[str]] = None,
     ) -> None:
         super().__init__(config=config)
-        if ort is None:
+        try:
+            ort = _load_onnxruntime()
+        except Exception as exc:  # pragma: no cover - 未安装 onnxruntime
             raise RuntimeError(
                 "未安装 onnxruntime，请通过 `uv sync --extra vision` 安装依赖"
-            ) from _onnx_error
+            ) from exc
         if cv2 is None:
             raise RuntimeError(
                 "未安装 OpenCV，无法对图像进行预处理，请启用 `vision` 额外依赖"
             ) from _cv_error
 
         self._spec = self._resolve_spec(model_type or (config.onnx_model_type if config else None))
-        self._model_path = self._resolve_model_path(model_path or (config.onnx_model_path if config else None))
+        providers = providers or ["CPUExecutionProvider"]
+        self._model_path = self._select_model_variant(
+            self._resolve_model_path(model_path or (config.onnx_model_path if config else None)),
+            providers,
+        )
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.enable_mem_pattern = True
         self._session = ort.InferenceSession(
             self._model_path,
-            providers=providers or ["CPUExecutionProvider"],
+            sess_options=options,
+            providers=providers,
         )
         inputs = self._session.get_inputs()
         if not inputs:
             raise RuntimeError("ONNX 模型缺少输入定义")
         self._input_name = inputs[0].name
+        self._input_buffer = np.empty(_input_shape(self._spec), dtype=np.float32)
+        self._bind_io(ort)
+
+    def _bind_io(self, ort) -> None:  # pragma: no cover - 依赖 onnxruntime
+        """预先绑定输入输出缓冲，逐帧推理时不再分配、复制张量。"""
+
+        try:
+            binding = self._session.io_binding()
+            binding.bind_ortvalue_input(self._input_name, ort.OrtValue.ortvalue_from_numpy(self._input_buffer))
+            output = self._session.get_outputs()[0]
+            shape = output.shape
+            if output.type == "tensor(float)" and all(isinstance(dim, int) and dim > 0 for dim in shape):
+                self._output_buffer = np.empty(tuple(shape), dtype=np.float32)
+                binding.bind_ortvalue_output(output.name, ort.OrtValue.ortvalue_from_numpy(self._output_buffer))
+            else:
+                # 动态输出形状无法预分配，交由 ORT 在 CPU 上分配
+                binding.bind_output(output.name, "cpu")
+        except Exception as exc:
+            logger.debug("ONNX IOBinding 初始化失败，改用常规推理: %s", exc, exc_info=True)
+            self._output_buffer = None
+            self._io_binding = None
+            return
+        self._io_binding = binding
 
     def estimate(self, frame_rgb: np.ndarray) -> Optional[PostureEstimate]:  # pragma: no cover - 依赖外部模型
         try:
             input_tensor = self._prepare_input(frame_rgb)
-            outputs = self._session.run(None, {self._input_name: input_tensor})
+            outputs = self._run(input_tensor)
         except Exception as exc:  # pragma: no cover - 推理失败时返回 None
             logger.debug("ONNX 姿态推理失败，将回退到其他信号: %s", exc, exc_info=True)
             return None
@@ -150,6 +213,15 @@ class ONNXPoseEstimator(PostureEstimator):
 
     # -- 内部工具 ---------------------------------------------------------
 
+    def _run(self, input_tensor: np.ndarray) -> list[np.ndarray]:  # pragma: no cover - 依赖 onnxruntime
+        binding = self._io_binding
+        if binding is None:
+            return self._session.run(None, {self._input_name: input_tensor})
+        self._session.run_with_iobinding(binding)
+        if self._output_buffer is not None:
+            return [self._output_buffer]
+        return binding.copy_outputs_to_cpu()
+
     def _resolve_spec(self, model_type: Optional[str]) -> OnnxModelSpec:
         specs = _known_model_specs()
         if not model_type:
@@ -167,23 +239,39 @@ class ONNXPoseEstimator(PostureEstimator):
             raise FileNotFoundError(f"找不到指定的 ONNX 模型文件: {path}")
         return str(path)
 
+    @staticmethod
+    def _select_model_variant(model_path: str, providers: list[str]) -> str:
+        """优先选用同目录下的量化模型：CoreML 后端用 FP16，CPU 后端用 INT8。"""
+
+        path = Path(model_path)
+        if path.stem.endswith((INT8_MODEL_SUFFIX, FP16_MODEL_SUFFIX)):
+            return model_path
+
+        suffixes = []
+        if "CoreMLExecutionProvider" in providers:
+            suffixes.append(FP16_MODEL_SUFFIX)
+        if "CPUExecutionProvider" in providers:
+            suffixes.append(INT8_MODEL_SUFFIX)
+        for suffix in suffixes:
+            candidate = path.with_name(f"{path.stem}{suffix}{path.suffix}")
+            if candidate.exists():
+                logger.info("使用量化 ONNX 模型: %s", candidate)
+                return str(candidate)
+        return model_path
+
     def _prepare_input(self, frame_rgb: np.ndarray) -> np.ndarray:
         width, height = self._spec.input_size
         resized = cv2.resize(frame_rgb, (width, height), interpolation=cv2.INTER_AREA)
-        tensor = resized.astype(np.float32)
-
-        mean = np.array(self._spec.mean, dtype=np.float32)
-        std = np.array(self._spec.std, dtype=np.float32)
-        tensor = (tensor - mean) / std
 
-        if self._spec.input_layout == "nhwc":
-            tensor = tensor[None, ...]
-        elif self._spec.input_layout == "nchw":
-            tensor = np.transpose(tensor, (2, 0, 1))[None, ...]
-        else:
-            raise ValueError(f"不支持的输入布局: {self._spec.input_layout}")
-
-        return tensor.astype(np.float32, copy=False)
+        tensor = self._input_buffer
+        if tensor is None:
+            tensor = np.empty(_input_shape(self._spec), dtype=np.float32)
+        # 归一化结果原地写入输入缓冲；nchw 布局经转置视图写入，无需额外复制
+        target = tensor[0] if self._spec.input_layout == "nhwc" else tensor[0].transpose(1, 2, 0)
+        mean, std = _normalization(self._spec)
+        np.subtract(resized, mean, out=target, casting="unsafe")
+        np.divide(target, std, out=target)
+        return tensor
 
     def _postprocess(self, outputs: list[np.ndarray]) -> PostureEstimate:
         if self._spec.output_type == "movenet":
@@ -193,17 +281,17 @@ class ONNXPoseEstimator(PostureEstimator):
         raise ValueError(f"不支持的输出类型: {self._spec.output_type}")
 
     def _postprocess_movenet(self, output: np.ndarray) -> PostureEstimate:
-        keypoints = np.array(output)
-        keypoints = np.squeeze(keypoints)
+        keypoints = np.squeeze(np.asarray(output))
         if keypoints.ndim != 2 or keypoints.shape[0] < len(self._spec.keypoint_names):
             raise ValueError(f"MoveNet 输出尺寸不符: {keypoints.shape}")
 
-        mapping = {}
-        for idx, name in enumerate(self._spec.keypoint_names):
-            y, x, score = keypoints[idx][:3]
-            mapping[name] = _KeyPoint(x=float(x), y=float(y), z=0.0, visibility=float(score))
-
-        return MediaPipePoseEstimator.compute_posture_from_keypoints(mapping, config=self._config)
+        # 一次取出躯干四个关键点的 (y, x, score)，重排为 (x, y, z=0, visibility)
+        torso = keypoints[_torso_indices(self._spec), :3].astype(np.float64)
+        points = np.zeros((len(TORSO_KEYPOINTS), 4), dtype=np.float64)
+        points[:, 0] = torso[:, 1]
+        points[:, 1] = torso[:, 0]
+        points[:, 3] = torso[:, 2]
+        return MediaPipePoseEstimator.compute_posture_from_array(points, config=self._config)
 
     def _postprocess_vector(self, output: np.ndarray) -> PostureEstimate:
         vector = np.array(output).reshape(-1)
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import datetime as dt
+import time
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Dict, List, Optional, Protocol, Union
 
 from upclock.config import AppConfig
-from upclock.core.signal_buffer import SignalBuffer, SignalRecord
+from upclock.core.signal_buffer import SignalBuffer, SignalRecord, to_timestamp_ns
+
+_NS_PER_SECOND = 1_000_000_000
+_NS_PER_MINUTE = 60 * _NS_PER_SECOND
 
 
 class ActivityState(Enum):
@@ -19,7 +23,7 @@ class ActivityState(Enum):
     PROLONGED_SEATED = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class ActivitySnapshot:
     """聚合后的活动快照。"""
 
@@ -28,6 +32,16 @@ class ActivitySnapshot:
     metrics: Dict[str, Union[float, str]]
     flow_mode_remaining: Optional[float] = None
 
+    def metric(self, name: str, default: float = 0.0) -> float:
+        """按浮点读取数值指标，缺失或为字符串时返回默认值。"""
+
+        value = self.metrics.get(name)
+        if value.__class__ is float:
+            return value  # type: ignore[return-value]
+        if value is None or isinstance(value, str):
+            return default
+        return float(value)
+
 
 class SignalBufferReader(Protocol):
     """信号缓存读取接口，用于供引擎消费。"""
@@ -35,6 +49,9 @@ class SignalBufferReader(Protocol):
     def snapshot(self) -> List[SignalRecord]:
         """返回当前信号快照。"""
 
+    def activity_since(self, cutoff_ns: int) -> float:
+        """返回截止时间之后的键鼠活跃量之和。"""
+
 
 class ActivityEngine:
     """根据缓冲信号计算用户在座情况。"""
@@ -43,16 +60,17 @@ class ActivityEngine:
         self._buffer = buffer
         self._config = config or AppConfig.load_default()
         window_minutes = max(1, min(self._config.short_break_minutes, 5))
-        self._activity_window = dt.timedelta(minutes=window_minutes)
-        self._baseline_activity = max(self._activity_window.total_seconds() / 6, 20.0)
-        self._seated_started_at: Optional[dt.datetime] = None
-        self._visual_probe_requested_at: Optional[dt.datetime] = None
-        self._visual_probe_triggered_at: Optional[dt.datetime] = None
-        self._visual_probe_cooldown = dt.timedelta(seconds=120)
-        self._visual_probe_window = dt.timedelta(seconds=90)
+        # 内部时间统一用自纪元起的整数纳秒，避免热路径上反复构造 datetime/timedelta
+        self._activity_window_ns = window_minutes * _NS_PER_MINUTE
+        self._baseline_activity = max(window_minutes * 60 / 6, 20.0)
+        self._seated_started_at_ns: Optional[int] = None
+        self._visual_probe_requested_at_ns: Optional[int] = None
+        self._visual_probe_triggered_at_ns: Optional[int] = None
+        self._visual_probe_cooldown_ns = 120 * _NS_PER_SECOND
+        self._visual_probe_window_ns = 90 * _NS_PER_SECOND
 
     def compute_snapshot(self) -> ActivitySnapshot:
-        now = self._now()
+        now_ns = self._now_ns()
         records = self._buffer.snapshot()
         if not records:
             return ActivitySnapshot(
@@ -67,25 +85,14 @@ class ActivityEngine:
                 },
             )
 
-        recent_records = [r for r in records if now - r.timestamp <= self._activity_window]
-        activity_sum = 0.0
-        has_recent_keyboard_mouse = False
-        for record in recent_records:
-            value = record.values.get("keyboard_mouse_activity")
-            if value is None:
-                value = record.values.get("total_events", 0.0)
-            try:
-                numeric = float(value)
-            except (TypeError, ValueError):
-                numeric = 0.0
-            if numeric > 0.0:
-                has_recent_keyboard_mouse = True
-            activity_sum += max(0.0, numeric)
+        # 各条活跃量已截断为非负，总和为正即说明窗口内存在键鼠输入
+        activity_sum = self._buffer.activity_since(now_ns - self._activity_window_ns)
+        has_recent_keyboard_mouse = activity_sum > 0.0
         normalized_activity = min(activity_sum / self._baseline_activity, 1.0) if activity_sum else 0.0
 
-        last_activity_at = self._last_activity_time(records)
-        if last_activity_at is None:
-            last_activity_at = records[-1].timestamp
+        last_activity_ns = self._last_activity_time(records)
+        if last_activity_ns is None:
+            last_activity_ns = records[-1].timestamp_ns
 
         presence = self._latest_presence(records)
         presence_confidence = presence.confidence if presence else None
@@ -95,7 +102,7 @@ class ActivityEngine:
             if presence.posture_state != "untracked" and presence.confidence > 0.05:
                 vision_signal = presence
 
-        break_minutes = max(0.0, (now - last_activity_at).total_seconds() / 60)
+        break_minutes = max(0.0, (now_ns - last_activity_ns) / _NS_PER_MINUTE)
 
         if (
             vision_signal is not None
@@ -104,12 +111,12 @@ class ActivityEngine:
         ):
             break_minutes = max(break_minutes, float(self._config.break_reset_minutes))
 
-        seated_minutes = self._update_seated_timer(now, last_activity_at, break_minutes)
+        seated_minutes = self._update_seated_timer(now_ns, last_activity_ns, break_minutes)
 
         state = self._resolve_state(seated_minutes, break_minutes)
 
         self._update_visual_probe_state(
-            now=now,
+            now_ns=now_ns,
             seated_minutes=seated_minutes,
             break_minutes=break_minutes,
             state=state,
@@ -129,53 +136,51 @@ class ActivityEngine:
             "posture_score": float(posture_score),
             "posture_state": presence.posture_state if presence else "unknown",
             "score": float(score),
-            "visual_probe_pending": 1.0 if self._should_request_visual_probe(now) else 0.0,
+            "visual_probe_pending": 1.0 if self._should_request_visual_probe(now_ns) else 0.0,
         }
 
         return ActivitySnapshot(score=score, state=state, metrics=metrics)
 
     def should_trigger_visual_probe(self, now: Optional[dt.datetime] = None) -> bool:
-        now = now or self._now()
-        return self._should_request_visual_probe(now)
+        now_ns = to_timestamp_ns(now) if now is not None else self._now_ns()
+        return self._should_request_visual_probe(now_ns)
 
-    def _should_request_visual_probe(self, now: dt.datetime) -> bool:
-        if self._visual_probe_requested_at is None:
+    def _should_request_visual_probe(self, now_ns: int) -> bool:
+        if self._visual_probe_requested_at_ns is None:
             return False
         if (
-            self._visual_probe_triggered_at is not None
-            and self._visual_probe_triggered_at >= self._visual_probe_requested_at
+            self._visual_probe_triggered_at_ns is not None
+            and self._visual_probe_triggered_at_ns >= self._visual_probe_requested_at_ns
         ):
             return False
-        if now - self._visual_probe_requested_at > self._visual_probe_window:
+        if now_ns - self._visual_probe_requested_at_ns > self._visual_probe_window_ns:
             return False
         return True
 
     def mark_visual_probe_fired(self, now: Optional[dt.datetime] = None) -> None:
-        if self._visual_probe_requested_at is None:
+        if self._visual_probe_requested_at_ns is None:
             return
-        self._visual_probe_triggered_at = now or self._now()
+        self._visual_probe_triggered_at_ns = to_timestamp_ns(now) if now is not None else self._now_ns()
 
     def reset_state(self) -> None:
         """重置内部计时器，适用于系统休眠或手动清零场景。"""
 
-        self._seated_started_at = None
-        self._visual_probe_requested_at = None
-        self._visual_probe_triggered_at = None
+        self._seated_started_at_ns = None
+        self._visual_probe_requested_at_ns = None
+        self._visual_probe_triggered_at_ns = None
 
-    def _update_seated_timer(
-        self, now: dt.datetime, last_activity_at: dt.datetime, break_minutes: float
-    ) -> float:
+    def _update_seated_timer(self, now_ns: int, last_activity_ns: int, break_minutes: float) -> float:
         if break_minutes >= self._config.break_reset_minutes:
-            self._seated_started_at = None
+            self._seated_started_at_ns = None
             return 0.0
 
-        if self._seated_started_at is None:
-            self._seated_started_at = last_activity_at
+        if self._seated_started_at_ns is None:
+            self._seated_started_at_ns = last_activity_ns
 
-        seated_minutes = max(0.0, (now - self._seated_started_at).total_seconds() / 60)
+        seated_minutes = max(0.0, (now_ns - self._seated_started_at_ns) / _NS_PER_MINUTE)
         return seated_minutes
 
-    def _last_activity_time(self, records: List[SignalRecord]) -> Optional[dt.datetime]:
+    def _last_activity_time(self, records: List[SignalRecord]) -> Optional[int]:
         """返回最近一次可视为“主动交互”的时间。
 
         键鼠事件优先；若长时间无键鼠输入，则当视觉置信度满足阈值时，
@@ -185,7 +190,7 @@ class ActivityEngine:
         for record in reversed(records):
             total = record.values.get("keyboard_mouse_activity") or record.values.get("total_events")
             if total and total > 0:
-                return record.timestamp
+                return record.timestamp_ns
 
             presence_conf = record.values.get("presence_confidence")
             if presence_conf is None:
@@ -209,7 +214,7 @@ class ActivityEngine:
                     continue
 
             # 缓冲中未提供 presence_state 时，仅凭置信度也视为仍在座位
-            return record.timestamp
+            return record.timestamp_ns
         return None
 
     def _resolve_state(self, seated_minutes: float, break_minutes: float) -> ActivityState:
@@ -220,7 +225,7 @@ class ActivityEngine:
         return ActivityState.ACTIVE
     def _update_visual_probe_state(
         self,
-        now: dt.datetime,
+        now_ns: int,
         seated_minutes: float,
         break_minutes: float,
         state: ActivityState,
@@ -235,30 +240,30 @@ class ActivityEngine:
         break_seconds = break_minutes * 60
 
         if break_seconds >= self._config.break_reset_minutes * 60:
-            self._visual_probe_requested_at = None
-            self._visual_probe_triggered_at = None
+            self._visual_probe_requested_at_ns = None
+            self._visual_probe_triggered_at_ns = None
             return
 
         threshold_seconds = prolonged_seconds * 0.95
         if seated_seconds < threshold_seconds:
-            self._visual_probe_requested_at = None
-            self._visual_probe_triggered_at = None
+            self._visual_probe_requested_at_ns = None
+            self._visual_probe_triggered_at_ns = None
             return
 
         if presence_confidence >= self._config.vision_presence_threshold and posture_state != "untracked":
-            self._visual_probe_requested_at = None
-            self._visual_probe_triggered_at = None
+            self._visual_probe_requested_at_ns = None
+            self._visual_probe_triggered_at_ns = None
             return
 
-        if self._visual_probe_requested_at is not None:
-            elapsed = now - self._visual_probe_requested_at
-            if elapsed <= self._visual_probe_window:
+        if self._visual_probe_requested_at_ns is not None:
+            elapsed_ns = now_ns - self._visual_probe_requested_at_ns
+            if elapsed_ns <= self._visual_probe_window_ns:
                 return
-            if elapsed <= self._visual_probe_cooldown:
+            if elapsed_ns <= self._visual_probe_cooldown_ns:
                 return
 
-        self._visual_probe_requested_at = now
-        self._visual_probe_triggered_at = None
+        self._visual_probe_requested_at_ns = now_ns
+        self._visual_probe_triggered_at_ns = None
 
 
     def _compute_score(
@@ -268,15 +273,16 @@ class ActivityEngine:
         modifier = posture_score if posture_score > 0 else 0.5
         return round((1.0 - ratio) * normalized_activity * modifier, 4)
 
-    def _now(self) -> dt.datetime:
-        return dt.datetime.utcnow()
+    def _now_ns(self) -> int:
+        # 信号时间戳来自 utcnow（墙上时间），这里保持同一时间轴
+        return time.time_ns()
 
     def update_config(self, config: AppConfig) -> None:
         """更新配置参数。"""
 
         self._config = config
 
-    @dataclass
+    @dataclass(slots=True, frozen=True)
     class _Presence:
         timestamp: dt.datetime
         confidence: float
@@ -2,33 +2,100 @@
 
 from __future__ import annotations
 
+import bisect
 import collections
 import datetime as dt
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Deque, Dict, Iterable, Iterator, List, Union
 
 
-@dataclass
+_EPOCH = dt.datetime(1970, 1, 1)
+
+
+def to_timestamp_ns(value: dt.datetime) -> int:
+    """将 UTC 时间（naive 视为 UTC）换算为自纪元起的整数纳秒。"""
+
+    if value.tzinfo is not None:
+        value = value.astimezone(dt.timezone.utc).replace(tzinfo=None)
+    delta = value - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+
+@dataclass(slots=True)
 class SignalRecord:
     """单条信号记录。"""
 
     timestamp: dt.datetime
     values: Dict[str, Union[float, str]]
+    timestamp_ns: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # 构造时换算一次，引擎扫描缓冲时只做整数比较
+        self.timestamp_ns = to_timestamp_ns(self.timestamp)
+
+
+def activity_value(values: Dict[str, Union[float, str]]) -> float:
+    """提取记录中的键鼠活跃量，缺失或非法时记为 0。"""
+
+    value = values.get("keyboard_mouse_activity")
+    if value is None:
+        value = values.get("total_events", 0.0)
+    try:
+        numeric = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return numeric if numeric > 0.0 else 0.0
 
 
 class SignalBuffer:
-    """环形缓冲区，支持多线程追加与快照。"""
+    """环形缓冲区，支持多线程追加与快照。
+
+    除完整记录外，另以列式保存有序时间戳与键鼠活跃量的累计和：
+    窗口求和只需二分定位起点，再用累计和相减。
+    """
 
     def __init__(self, maxlen: int = 600) -> None:
+        self._maxlen = maxlen
         self._records: Deque[SignalRecord] = collections.deque(maxlen=maxlen)
+        # 列表只追加，过期部分由 _start 标记，积累到一定长度后整体裁剪
+        self._timestamps_ns: List[int] = []
+        self._cumulative: List[float] = []
+        self._start = 0
+        self._base = 0.0
         self._lock = threading.Lock()
 
     def append(self, record: SignalRecord) -> None:
         """追加新信号。"""
 
+        activity = activity_value(record.values)
         with self._lock:
             self._records.append(record)
+            timestamps, cumulative = self._timestamps_ns, self._cumulative
+            # 跨线程写入或时钟回拨可能带来微小乱序，截平后保证二分查找有效
+            timestamp_ns = record.timestamp_ns
+            if timestamps and timestamp_ns < timestamps[-1]:
+                timestamp_ns = timestamps[-1]
+            timestamps.append(timestamp_ns)
+            cumulative.append((cumulative[-1] if cumulative else self._base) + activity)
+            if len(timestamps) - self._start > self._maxlen:
+                self._start += 1
+                if self._start >= self._maxlen:
+                    self._base = cumulative[self._start - 1]
+                    del timestamps[: self._start]
+                    del cumulative[: self._start]
+                    self._start = 0
+
+    def activity_since(self, cutoff_ns: int) -> float:
+        """返回时间戳不早于 ``cutoff_ns`` 的记录的键鼠活跃量之和。"""
+
+        with self._lock:
+            cumulative = self._cumulative
+            if len(cumulative) == self._start:
+                return 0.0
+            index = bisect.bisect_left(self._timestamps_ns, cutoff_ns, lo=self._start)
+            before = cumulative[index - 1] if index > 0 else self._base
+            return max(0.0, cumulative[-1] - before)
 
     def iter_recent_metrics(self) -> Iterator[Dict[str, Union[float, str]]]:
         """遍历当前缓存的所有指标。"""
@@ -48,3 +115,7 @@ class SignalBuffer:
 
         with self._lock:
             self._records.clear()
+            self._timestamps_ns.clear()
+            self._cumulative.clear()
+            self._start = 0
+            self._base = 0.0
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 import datetime as dt
 import logging
 import random
 import threading
 import time
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Deque, Optional
 
 from upclock.adapters.macos import MacOSInputMonitor, MacOSWindowMonitor
 from upclock.adapters.vision import (
@@ -77,12 +78,41 @@ def _quiet_status(now: dt.datetime, slots: list[tuple[int, int]]) -> tuple[bool,
     return False, 0.0
 
 
+def _round_minutes(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 1)
+
+
+def _status_display_key(
+    state: Optional[ActivityState],
+    score: float,
+    seated_minutes: float,
+    break_minutes: float,
+    next_reminder_minutes: Optional[float],
+    flow_mode_minutes: Optional[float],
+    snooze_minutes: Optional[float],
+    quiet_minutes: Optional[float],
+) -> tuple:
+    """按状态栏的展示精度（百分比取整、分钟保留一位小数）生成比较键。
+
+    键不变时沿用上一份 StatusSnapshot，状态栏轮询凭实例身份即可跳过刷新。
+    """
+
+    return (
+        state,
+        round(score * 100),
+        round(seated_minutes, 1),
+        round(break_minutes, 1),
+        _round_minutes(next_reminder_minutes),
+        _round_minutes(flow_mode_minutes),
+        _round_minutes(snooze_minutes),
+        _round_minutes(quiet_minutes),
+    )
+
+
 @dataclass
 class SharedState:
     """共享状态，用于状态栏读取最新快照。"""
 
-    status: Optional[StatusSnapshot] = None
-    activity: Optional[ActivitySnapshot] = None
     notification: Optional[NotificationMessage] = None
     system_sleeping: bool = False
     system_state_changed_at: float = 0.0
@@ -92,6 +122,11 @@ class SharedState:
     _settings_update: Optional[UserSettings] = None
     _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
     _manual_reset_requested: bool = field(default=False, init=False, repr=False)
+    # 最新快照以不可变元组整体替换发布，读取方无需加锁
+    _published: Optional[tuple[StatusSnapshot, ActivitySnapshot]] = field(
+        default=None, init=False, repr=False
+    )
+    _notification_listener: Optional[Callable[[], None]] = field(default=None, init=False, repr=False)
 
     def set(
         self,
@@ -99,11 +134,20 @@ class SharedState:
         status: StatusSnapshot,
         notification: Optional[NotificationMessage] = None,
     ) -> None:
-        with self._lock:
-            self.activity = activity
-            self.status = status
-            if notification is not None:
+        self._published = (status, activity)
+        if notification is not None:
+            with self._lock:
                 self.notification = notification
+                listener = self._notification_listener
+            # 通知生成后立即唤醒状态栏轮询，不必等到下一次低频轮询
+            if listener is not None:
+                listener()
+
+    def set_notification_listener(self, listener: Optional[Callable[[], None]]) -> None:
+        """注册新通知入队时的回调，回调在后台线程中执行，需自行保证线程安全。"""
+
+        with self._lock:
+            self._notification_listener = listener
 
     def set_system_sleeping(self, sleeping: bool) -> None:
         """更新系统睡眠状态。"""
@@ -121,12 +165,12 @@ class SharedState:
             return self.system_state_changed_at
 
     def get_status(self) -> Optional[StatusSnapshot]:
-        with self._lock:
-            return self.status
+        published = self._published
+        return published[0] if published is not None else None
 
     def get_activity(self) -> Optional[ActivitySnapshot]:
-        with self._lock:
-            return self.activity
+        published = self._published
+        return published[1] if published is not None else None
 
     def pop_notification(self) -> Optional[NotificationMessage]:
         with self._lock:
@@ -281,11 +325,42 @@ async def run_backend(shared: SharedState) -> None:
     await input_monitor.start()
     await window_monitor.start()
 
+    # 视觉控制器更新与快照发布解耦：主循环只入队，由后台任务合并后执行
+    vision_updates: Deque[tuple[float, float, str, float]] = collections.deque(maxlen=4)
+    vision_update_ready = asyncio.Event()
+    vision_update_task: Optional[asyncio.Task[None]] = None
+
+    async def _vision_update_worker() -> None:
+        assert vision_controller is not None
+        while True:
+            await vision_update_ready.wait()
+            vision_update_ready.clear()
+            if not vision_updates:
+                continue
+            # 只有最新的在位信息有意义，较早的更新直接丢弃
+            update_break, update_presence, update_posture, update_at = vision_updates[-1]
+            vision_updates.clear()
+            try:
+                vision_controller.update(
+                    break_minutes=update_break,
+                    presence_confidence=update_presence,
+                    posture_state=update_posture,
+                    now=update_at,
+                )
+            except Exception:  # pragma: no cover - 控制器异常不影响主循环
+                logging.getLogger(__name__).warning("视觉控制器更新失败", exc_info=True)
+
+    if vision_controller is not None:
+        vision_update_task = asyncio.create_task(_vision_update_worker())
+
     last_notification_at: Optional[float] = None
     last_suggestion: Optional[str] = None
     cooldown_seconds = config.notification_cooldown_minutes * 60
     was_sleeping = shared.is_system_sleeping()
     prev_state: Optional[ActivityState] = None
+    # 状态栏快照享元：展示内容不变时复用同一实例，updated_at 记录的是最近一次可见变化
+    status: Optional[StatusSnapshot] = None
+    status_key: Optional[tuple] = None
     last_tick = time.time()
     daily_date = dt.date.today()
     daily_prolonged_seconds = 0.0
@@ -371,21 +446,26 @@ async def run_backend(shared: SharedState) -> None:
                     flow_mode_remaining=flow_remaining if flow_active else None,
                 )
 
-                shared.set(
-                    activity=snapshot,
-                    status=StatusSnapshot(
+                flow_minutes = flow_remaining if flow_active else None
+                snooze_minutes = snooze_remaining if snooze_active else None
+                quiet_minutes = quiet_remaining if quiet_active else None
+                key = _status_display_key(
+                    ActivityState.SHORT_BREAK, 1.0, 0.0, 0.0, None, flow_minutes, snooze_minutes, quiet_minutes
+                )
+                if status is None or key != status_key:
+                    status = StatusSnapshot(
                         state=ActivityState.SHORT_BREAK,
                         score=1.0,
                         seated_minutes=0.0,
                         break_minutes=0.0,
                         updated_at=now,
                         next_reminder_minutes=None,
-                        flow_mode_minutes=flow_remaining if flow_active else None,
-                        snooze_minutes=snooze_remaining if snooze_active else None,
-                        quiet_minutes=quiet_remaining if quiet_active else None,
-                    ),
-                    notification=None,
-                )
+                        flow_mode_minutes=flow_minutes,
+                        snooze_minutes=snooze_minutes,
+                        quiet_minutes=quiet_minutes,
+                    )
+                    status_key = key
+                shared.set(activity=snapshot, status=status, notification=None)
 
                 last_notification_at = None
                 was_sleeping = True
@@ -406,20 +486,20 @@ async def run_backend(shared: SharedState) -> None:
             snapshot.metrics["snooze_active"] = 1.0 if snooze_active else 0.0
             snapshot.metrics["snooze_remaining"] = float(snooze_remaining if snooze_active else 0.0)
 
-            probe_pending = float(snapshot.metrics.get("visual_probe_pending", 0.0) or 0.0) >= 0.5
+            probe_pending = snapshot.metric("visual_probe_pending") >= 0.5
             if probe_pending and vision_adapter is not None:
                 await vision_adapter.probe(duration=3.0, interval=0.5)
                 engine.mark_visual_probe_fired()
                 snapshot = engine.compute_snapshot()
 
             now = time.time()
-            seated_minutes = snapshot.metrics.get("seated_minutes", 0.0)
-            break_minutes = snapshot.metrics.get("break_minutes", 0.0)
+            seated_minutes = snapshot.metric("seated_minutes")
+            break_minutes = snapshot.metric("break_minutes")
 
             if snapshot.state is ActivityState.PROLONGED_SEATED:
                 daily_prolonged_seconds += delta
 
-            current_seated_seconds = float(seated_minutes or 0.0) * 60.0
+            current_seated_seconds = seated_minutes * 60.0
             if current_seated_seconds > daily_longest_seated_seconds:
                 daily_longest_seated_seconds = current_seated_seconds
 
@@ -476,43 +556,66 @@ async def run_backend(shared: SharedState) -> None:
             elif quiet_active and snapshot.state is ActivityState.PROLONGED_SEATED:
                 next_reminder_minutes = quiet_remaining
 
-            shared.set(
-                activity=snapshot,
-                status=StatusSnapshot(
+            flow_minutes = flow_remaining if flow_active else None
+            snooze_minutes = snooze_remaining if snooze_active else None
+            quiet_minutes = quiet_remaining if quiet_active else None
+            key = _status_display_key(
+                snapshot.state,
+                snapshot.score,
+                seated_minutes,
+                break_minutes,
+                next_reminder_minutes,
+                flow_minutes,
+                snooze_minutes,
+                quiet_minutes,
+            )
+            if status is None or key != status_key:
+                status = StatusSnapshot(
                     state=snapshot.state,
                     score=snapshot.score,
                     seated_minutes=seated_minutes,
                     break_minutes=break_minutes,
                     updated_at=now,
                     next_reminder_minutes=next_reminder_minutes,
-                    flow_mode_minutes=flow_remaining if flow_active else None,
-                    snooze_minutes=snooze_remaining if snooze_active else None,
-                    quiet_minutes=quiet_remaining if quiet_active else None,
-                ),
-                notification=notification,
-            )
+                    flow_mode_minutes=flow_minutes,
+                    snooze_minutes=snooze_minutes,
+                    quiet_minutes=quiet_minutes,
+                )
+                status_key = key
+            shared.set(activity=snapshot, status=status, notification=notification)
 
             prev_state = snapshot.state
 
             if vision_controller is not None:
-                presence_conf = float(snapshot.metrics.get("presence_confidence", 0.0) or 0.0)
+                presence_conf = snapshot.metric("presence_confidence")
                 posture_state = str(snapshot.metrics.get("posture_state", "unknown"))
-                vision_controller.update(
-                    break_minutes=break_minutes,
-                    presence_confidence=presence_conf,
-                    posture_state=posture_state,
-                    now=now,
-                )
+                vision_updates.append((break_minutes, presence_conf, posture_state, now))
+                vision_update_ready.set()
             await asyncio.sleep(2.0)
     finally:
-        input_monitor.stop()
-        window_monitor.stop()
+        if vision_update_task is not None:
+            vision_update_task.cancel()
+            # 等待取消真正完成，避免事件循环关闭时残留 pending 任务
+            await asyncio.gather(vision_update_task, return_exceptions=True)
+        # 各项关闭互不依赖，并行执行使总耗时取决于最慢的一项
+        shutdown_steps = [_async_stop(input_monitor), _async_stop(window_monitor)]
         if vision_controller is not None:
-            await vision_controller.aclose()
+            shutdown_steps.append(vision_controller.aclose())
+        results = await asyncio.gather(*shutdown_steps, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                logging.getLogger(__name__).warning("关闭后台组件失败: %s", result)
         if vision_adapter is not None:
             vision_adapter.stop()
 
 
+async def _async_stop(adapter: MacOSInputMonitor | MacOSWindowMonitor) -> None:
+    """在线程池中执行同步的 stop()，避免阻塞事件循环。"""
+
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, adapter.stop)
+
+
 def start_backend_in_thread(shared: SharedState) -> threading.Thread:
     """在独立线程运行 asyncio 后台服务。"""
 
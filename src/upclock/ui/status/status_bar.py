@@ -2,66 +2,135 @@
 
 from __future__ import annotations
 
+import asyncio
+import itertools
+import os
+import plistlib
+import re
 import sys
+import threading
 import time
+import webbrowser
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Any, Callable, NamedTuple, Optional
 
 import rumps
 
-try:  # pragma: no cover - 仅在 macOS GUI 环境下可用
-    import objc  # type: ignore
-    from Cocoa import (  # type: ignore
-        NSApp,
-        NSAlert,
-        NSAlertFirstButtonReturn,
-        NSAlertSecondButtonReturn,
-        NSColor,
-        NSFont,
-        NSInformationalRequest,
-        NSLineBreakByWordWrapping,
-        NSMakeRect,
-        NSMaxYEdge,
-        NSPopover,
-        NSPopoverBehaviorTransient,
-        NSSlider,
-        NSTextField,
-        NSView,
-        NSViewController,
-    )
-    from Foundation import (  # type: ignore
-        NSUserNotification,
-        NSUserNotificationCenter,
-        NSUserNotificationDefaultSoundName,
-    )
-except Exception:  # pragma: no cover - 测试环境/非 GUI 环境
-    objc = None  # type: ignore
-    NSApp = None  # type: ignore
-    NSAlert = None  # type: ignore
-    NSAlertFirstButtonReturn = 1000  # type: ignore
-    NSAlertSecondButtonReturn = 1001  # type: ignore
-    NSColor = None  # type: ignore
-    NSFont = None  # type: ignore
-    NSInformationalRequest = 0  # type: ignore
-    NSLineBreakByWordWrapping = 0  # type: ignore
-    NSMakeRect = None  # type: ignore
-    NSMaxYEdge = 0  # type: ignore
-    NSPopover = None  # type: ignore
-    NSPopoverBehaviorTransient = 0  # type: ignore
-    NSSlider = None  # type: ignore
-    NSTextField = None  # type: ignore
-    NSView = None  # type: ignore
-    NSViewController = None  # type: ignore
-    NSUserNotification = None  # type: ignore
-    NSUserNotificationCenter = None  # type: ignore
-    NSUserNotificationDefaultSoundName = None  # type: ignore
+# Cocoa 绑定体积较大，推迟到首次创建状态栏应用时由 `_load_cocoa()` 导入；
+# 在此之前（以及非 GUI 环境下）以下名称保持占位值。
+objc = None  # type: ignore
+NSApp = None  # type: ignore
+NSAlert = None  # type: ignore
+NSAlertFirstButtonReturn = 1000  # type: ignore
+NSAlertSecondButtonReturn = 1001  # type: ignore
+NSButton = None  # type: ignore
+NSColor = None  # type: ignore
+NSFont = None  # type: ignore
+NSInformationalRequest = 0  # type: ignore
+NSLineBreakByWordWrapping = 0  # type: ignore
+NSMakeRect = None  # type: ignore
+NSMaxYEdge = 0  # type: ignore
+NSPopover = None  # type: ignore
+NSPopoverBehaviorTransient = 0  # type: ignore
+NSSlider = None  # type: ignore
+NSTextField = None  # type: ignore
+NSView = None  # type: ignore
+NSViewController = None  # type: ignore
+NSUserNotification = None  # type: ignore
+NSUserNotificationCenter = None  # type: ignore
+NSUserNotificationDefaultSoundName = None  # type: ignore
+AppHelper = None  # type: ignore
+
+_TransientPopoverController = None  # type: ignore
+_ConfirmPopoverController = None  # type: ignore
+_FlowSliderDelegate = None  # type: ignore
+_NotificationCenterDelegate = None  # type: ignore
+_StatusMenuDelegate = None  # type: ignore
+_SLIDER_CHANGED_SEL = None  # type: ignore
+_NOTIFICATION_HAS_IDENTIFIER = False
+_NOTIFICATION_HAS_ACTION_BUTTON = False
+_COCOA_LOADED = False
 
 from upclock.config_store import UserSettings
 from upclock.core.activity_engine import ActivitySnapshot, ActivityState
 
-
-@dataclass
+# 轮询节奏随下一次提醒的远近调整：临近提醒时高频，平时低频
+_POLL_INTERVAL_IMMINENT = 2.0
+_POLL_INTERVAL_NEAR = 10.0
+_POLL_INTERVAL_BACKGROUND = 60.0
+# 低频轮询对齐到整分，距下一整分不足该值时顺延一分钟，避免边界附近连续唤醒
+_MINUTE_ALIGN_MIN_SECONDS = 1.0
+_REMINDER_IMMINENT_MINUTES = 1.0
+_REMINDER_NEAR_MINUTES = 5.0
+
+_DASHBOARD_URL = "http://127.0.0.1:8000/"
+
+# 通知标识：进程启动时刻作前缀，避免与历史通知重名，进程内用计数器递增
+_NOTIFICATION_ID_PREFIX = f"upclock-{int(time.time())}-"
+_NOTIFICATION_IDS = itertools.count()
+_NOTIFICATION_REPEAT_SUPPRESS_SECONDS = 30.0
+
+# 短时间内的多条提醒合并为一次横幅，重复内容在数秒内不再弹出
+_BANNER_DEBOUNCE_SECONDS = 0.3
+_BANNER_REPEAT_SUPPRESS_SECONDS = 5.0
+_BANNER_DISPLAY_SECONDS = 4.0
+
+_DEFAULT_STATUS_TITLE = "👨🏻‍💻"
+_TITLE_FOR_STATE = {
+    ActivityState.PROLONGED_SEATED: "💥",
+    ActivityState.SHORT_BREAK: "☕",
+}
+_STATE_LABEL = {
+    ActivityState.ACTIVE: "活跃",
+    ActivityState.SHORT_BREAK: "短暂休息",
+    ActivityState.PROLONGED_SEATED: "久坐",
+}
+
+# 菜单文案模板，配合按显示精度取整后的数值缓存，数值不变时连格式化都跳过
+_TMPL_STATE = "状态：%s"
+_TMPL_FOCUS = "专注指数：%.0f%%"
+_TMPL_SEAT = "在座：%.1f 分钟 / 休息：%.1f"
+_TMPL_QUIET = "静默中：%.1f 分"
+_TMPL_SNOOZE = "延后：%.1f 分"
+_TMPL_FLOW = "心流：%.1f 分"
+_TMPL_NEXT = "下一次提醒：%.1f 分"
+_TEXT_NEXT_NONE = "下一次提醒：--"
+# 对话框布局（NSRect 以 ((x, y), (w, h)) 元组表示，PyObjC 可直接接收，无需在打开时逐个 NSMakeRect）
+_SETTINGS_CONTAINER_FRAME = ((0.0, 0.0), (280.0, 220.0))
+_SETTINGS_PROLONGED_LABEL_FRAME = ((0.0, 192.0), (280.0, 18.0))
+_SETTINGS_PROLONGED_VALUE_FRAME = ((0.0, 168.0), (280.0, 22.0))
+_SETTINGS_PROLONGED_SLIDER_FRAME = ((0.0, 136.0), (280.0, 24.0))
+_SETTINGS_COOLDOWN_LABEL_FRAME = ((0.0, 112.0), (280.0, 18.0))
+_SETTINGS_COOLDOWN_VALUE_FRAME = ((0.0, 88.0), (280.0, 22.0))
+_SETTINGS_COOLDOWN_SLIDER_FRAME = ((0.0, 56.0), (280.0, 24.0))
+_SETTINGS_QUIET_LABEL_FRAME = ((0.0, 40.0), (280.0, 18.0))
+_SETTINGS_QUIET_FIELD_FRAME = ((0.0, 16.0), (280.0, 22.0))
+_FLOW_CONTAINER_FRAME = ((0.0, 0.0), (220.0, 70.0))
+_FLOW_VALUE_FRAME = ((0.0, 40.0), (220.0, 22.0))
+_FLOW_SLIDER_FRAME = ((0.0, 10.0), (220.0, 24.0))
+_CONFIRM_CONTAINER_FRAME = ((0.0, 0.0), (280.0, 96.0))
+_CONFIRM_MESSAGE_FRAME = ((12.0, 44.0), (256.0, 40.0))
+_CONFIRM_CANCEL_FRAME = ((108.0, 10.0), (76.0, 28.0))
+_CONFIRM_OK_FRAME = ((192.0, 10.0), (76.0, 28.0))
+
+# 设置该环境变量时确认框退回同步的 rumps.alert，便于调试与自动化
+_SYNC_DIALOGS_ENV = "UPCLOCK_SYNC_DIALOGS"
+
+# 延后提醒子菜单提供的时长（分钟）
+_SNOOZE_OPTIONS = (5, 15, 30)
+# 心流/延后菜单缓存中表示“未配置”的标记
+_MENU_UNCONFIGURED = object()
+
+# 静默时段输入："起-止" 以逗号分隔，允许空段与首尾空白；起点不含 "-"，终点取第一个 "-" 之后的全部
+_QUIET_START = r"[^,\-\s](?:[^,\-]*[^,\-\s])?"
+_QUIET_END = r"[^,\s](?:[^,]*[^,\s])?"
+_QUIET_SEGMENT = rf"\s*(?:{_QUIET_START}\s*-\s*{_QUIET_END}\s*)?"
+_QUIET_INPUT_RE = re.compile(rf"{_QUIET_SEGMENT}(?:,{_QUIET_SEGMENT})*")
+_QUIET_PAIR_RE = re.compile(rf"({_QUIET_START})\s*-\s*({_QUIET_END})")
+
+
+@dataclass(slots=True, frozen=True)
 class StatusSnapshot:
     """供状态栏显示的数据。"""
 
@@ -76,7 +145,7 @@ class StatusSnapshot:
     quiet_minutes: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NotificationMessage:
     """状态栏要显示的提醒消息。"""
 
@@ -85,7 +154,77 @@ class NotificationMessage:
     body: str
 
 
-if NSViewController is not None and objc is not None:  # pragma: no cover - GUI 逻辑无需测试
+class _SettingsAccessory(NamedTuple):
+    """提醒设置对话框的附加视图及其控件，首次打开时构建后复用。"""
+
+    container: Any
+    prolonged_slider: Any
+    cooldown_slider: Any
+    quiet_field: Any
+    prolonged_delegate: Any
+    cooldown_delegate: Any
+
+
+class _FlowAccessory(NamedTuple):
+    """心流时长对话框的附加视图及其控件。"""
+
+    container: Any
+    slider: Any
+    delegate: Any
+
+
+def _load_cocoa() -> None:  # pragma: no cover - 仅在 macOS GUI 环境下可用
+    """导入 Cocoa 绑定，并定义依赖它的 Objective-C 子类，仅执行一次。"""
+
+    global _COCOA_LOADED, objc, NSApp, NSAlert, NSAlertFirstButtonReturn, NSAlertSecondButtonReturn, NSButton
+    global NSColor, NSFont, NSInformationalRequest, NSLineBreakByWordWrapping, NSMakeRect, NSMaxYEdge
+    global NSPopover, NSPopoverBehaviorTransient, NSSlider, NSTextField, NSView, NSViewController
+    global NSUserNotification, NSUserNotificationCenter, NSUserNotificationDefaultSoundName, AppHelper
+    global _TransientPopoverController, _ConfirmPopoverController
+    global _FlowSliderDelegate, _NotificationCenterDelegate, _StatusMenuDelegate
+    global _SLIDER_CHANGED_SEL, _NOTIFICATION_HAS_IDENTIFIER, _NOTIFICATION_HAS_ACTION_BUTTON
+
+    if _COCOA_LOADED:
+        return
+    _COCOA_LOADED = True
+
+    try:
+        import objc  # type: ignore
+        from Cocoa import (  # type: ignore
+            NSApp,
+            NSAlert,
+            NSAlertFirstButtonReturn,
+            NSAlertSecondButtonReturn,
+            NSButton,
+            NSColor,
+            NSFont,
+            NSInformationalRequest,
+            NSLineBreakByWordWrapping,
+            NSMakeRect,
+            NSMaxYEdge,
+            NSPopover,
+            NSPopoverBehaviorTransient,
+            NSSlider,
+            NSTextField,
+            NSView,
+            NSViewController,
+        )
+        from Foundation import (  # type: ignore
+            NSUserNotification,
+            NSUserNotificationCenter,
+            NSUserNotificationDefaultSoundName,
+        )
+        from PyObjCTools import AppHelper  # type: ignore
+    except Exception:  # 测试环境/非 GUI 环境
+        objc = None  # type: ignore
+        NSApp = NSAlert = NSButton = NSColor = NSFont = NSMakeRect = None  # type: ignore
+        NSPopover = NSSlider = NSTextField = NSView = NSViewController = None  # type: ignore
+        NSUserNotification = NSUserNotificationCenter = NSUserNotificationDefaultSoundName = None  # type: ignore
+        AppHelper = None  # type: ignore
+        return
+
+    _NOTIFICATION_HAS_IDENTIFIER = hasattr(NSUserNotification, "setIdentifier_")
+    _NOTIFICATION_HAS_ACTION_BUTTON = hasattr(NSUserNotification, "setHasActionButton_")
 
     class _TransientPopoverController(NSViewController):
         """用于渲染短暂提醒内容的简单视图控制器。"""
@@ -113,19 +252,72 @@ if NSViewController is not None and objc is not None:  # pragma: no cover - GUI
 
             view.addSubview_(field)
             self.view = view
+            self._message_field = field
+            self._message = message
             return self
 
-else:  # pragma: no cover - 非 GUI 环境无需控制器
+        @objc.python_method
+        def setMessage_(self, message: str) -> None:
+            # 文本未变时跳过桥接调用
+            if message == self._message:
+                return
+            self._message_field.setStringValue_(message)
+            self._message = message
 
-    class _TransientPopoverController:  # type: ignore[override]
-        def alloc(self):  # type: ignore[misc]
-            return self
+    class _ConfirmPopoverController(NSViewController):
+        """非模态确认框：消息文本加“继续/结束”两个按钮，结果通过回调返回。"""
 
-        def initWithMessage_(self, _message: str):  # type: ignore[override]
+        def init(self):  # type: ignore[override]
+            self = objc.super(_ConfirmPopoverController, self).init()
+            if self is None:
+                return None
+
+            view = NSView.alloc().initWithFrame_(_CONFIRM_CONTAINER_FRAME)
+            field = NSTextField.alloc().initWithFrame_(_CONFIRM_MESSAGE_FRAME)
+            field.setEditable_(False)
+            field.setBordered_(False)
+            field.setBezeled_(False)
+            field.setDrawsBackground_(False)
+            field.setSelectable_(False)
+            field.setLineBreakMode_(NSLineBreakByWordWrapping)
+            view.addSubview_(field)
+
+            for frame, title, action in (
+                (_CONFIRM_CANCEL_FRAME, "继续", "cancelClicked:"),
+                (_CONFIRM_OK_FRAME, "结束", "confirmClicked:"),
+            ):
+                button = NSButton.alloc().initWithFrame_(frame)
+                button.setTitle_(title)
+                button.setBezelStyle_(1)  # NSBezelStyleRounded
+                button.setTarget_(self)
+                button.setAction_(action)
+                view.addSubview_(button)
+
+            self.view = view
+            self._message_field = field
+            self._popover = None
+            self._on_confirm = None
             return self
 
+        @objc.python_method
+        def configure(self, popover, message: str, on_confirm: Callable[[], None]) -> None:
+            self._popover = popover
+            self._message_field.setStringValue_(message)
+            self._on_confirm = on_confirm
 
-if objc is not None and NSSlider is not None and NSTextField is not None:  # pragma: no cover
+        @objc.python_method
+        def _finish(self, confirmed: bool) -> None:
+            callback, self._on_confirm = self._on_confirm, None
+            if self._popover is not None:
+                self._popover.performClose_(None)
+            if confirmed and callback is not None:
+                callback()
+
+        def confirmClicked_(self, _sender):  # type: ignore[override]
+            self._finish(True)
+
+        def cancelClicked_(self, _sender):  # type: ignore[override]
+            self._finish(False)
 
     class _FlowSliderDelegate(objc.lookUpClass("NSObject")):
         """帮助更新心流滑块数值显示。"""
@@ -142,12 +334,8 @@ if objc is not None and NSSlider is not None and NSTextField is not None:  # pra
             if self._label is not None:
                 self._label.setStringValue_(f"{value:.0f} 分钟")
 
-else:  # pragma: no cover - 非 GUI 环境无需滑块
-
-    _FlowSliderDelegate = None  # type: ignore
-
-
-if objc is not None and NSUserNotificationCenter is not None:  # pragma: no cover
+    # 滑块回调选择子只需构造一次，供各设置对话框复用
+    _SLIDER_CHANGED_SEL = objc.selector(_FlowSliderDelegate.sliderChanged_, signature=b"v@:@")
 
     class _NotificationCenterDelegate(objc.lookUpClass("NSObject")):
         """保证应用前台时仍可展示系统通知。"""
@@ -155,9 +343,34 @@ if objc is not None and NSUserNotificationCenter is not None:  # pragma: no cove
         def userNotificationCenter_shouldPresentNotification_(self, _center, _notification):  # type: ignore[override]
             return True
 
-else:  # pragma: no cover - 非 GUI 环境无需通知代理
+    class _StatusMenuDelegate(objc.lookUpClass("NSObject")):
+        """跟踪状态栏菜单的展开/收起，转发给 StatusBarApp。"""
+
+        def initWithApp_(self, app):  # type: ignore[override]
+            self = objc.super(_StatusMenuDelegate, self).init()
+            if self is None:
+                return None
+            self._app = app
+            return self
+
+        def menuWillOpen_(self, _menu):  # type: ignore[override]
+            self._app._handle_menu_will_open()
+
+        def menuDidClose_(self, _menu):  # type: ignore[override]
+            self._app._handle_menu_did_close()
+
 
-    _NotificationCenterDelegate = None  # type: ignore
+
+def _ignore_menu_click(_sender: rumps.MenuItem) -> None:
+    """占位回调：保持菜单项可见但点击无效果。"""
+
+
+def _open_dashboard_callback(_sender: rumps.MenuItem) -> None:
+    webbrowser.open(_DASHBOARD_URL)
+
+
+def _quit_callback(_sender: rumps.MenuItem) -> None:
+    rumps.quit_application()
 
 
 class StatusBarApp(rumps.App):
@@ -178,7 +391,9 @@ class StatusBarApp(rumps.App):
         settings_provider: Optional[Callable[[], Optional[UserSettings]]] = None,
         update_settings: Optional[Callable[[UserSettings], None]] = None,
         refresh_callback: Optional[Callable[[], None]] = None,
+        bind_notification_wakeup: Optional[Callable[[Callable[[], None]], None]] = None,
     ) -> None:
+        _load_cocoa()
         _ensure_info_plist()
         super().__init__(name="upClock", title="⌚", quit_button=None)
         self._snapshot_provider = snapshot_provider
@@ -195,133 +410,269 @@ class StatusBarApp(rumps.App):
         self._update_settings = update_settings
         self._refresh_callback = refresh_callback
         self._notification_delegate_ref = None
+        self._reusable_notification = None
+        self._last_notification: Optional[NotificationMessage] = None
+        self._last_notification_at = 0.0
         self._banner_popover = None
-        self._banner_timer: Optional[rumps.Timer] = None
+        self._banner_controller = None
+        self._confirm_popover = None
+        self._confirm_controller = None
+        # 横幅的防抖与自动收起各用一个常驻计时器，按需重新启动
+        self._banner_timer = rumps.Timer(self._close_transient_banner, _BANNER_DISPLAY_SECONDS)
+        self._banner_close_at = 0.0
+        self._banner_supported: Optional[bool] = None
+        self._status_button = None
+        self._settings_accessory: Optional[_SettingsAccessory] = None
+        self._flow_accessory: Optional[_FlowAccessory] = None
+        self._pending_banner: list[str] = []
+        self._banner_debounce_timer = rumps.Timer(self._flush_banner, _BANNER_DEBOUNCE_SECONDS)
+        self._banner_flush_at = 0.0
+        self._last_banner_text: Optional[str] = None
+        self._last_banner_at = 0.0
         self._flow_menu_item = rumps.MenuItem(title="心流模式：关闭", callback=self._handle_flow_mode)
         self._snooze_menu = rumps.MenuItem("延后提醒")
-        self._snooze_5 = rumps.MenuItem("延后 5 分钟", lambda _: self._handle_snooze(5))
-        self._snooze_15 = rumps.MenuItem("延后 15 分钟", lambda _: self._handle_snooze(15))
-        self._snooze_30 = rumps.MenuItem("延后 30 分钟", lambda _: self._handle_snooze(30))
+        self._snooze_items: list[rumps.MenuItem] = []
+        for minutes in _SNOOZE_OPTIONS:
+            item = rumps.MenuItem(f"延后 {minutes} 分钟", self._handle_snooze_menu)
+            item._snooze_minutes = minutes
+            self._snooze_items.append(item)
+            self._snooze_menu.add(item)
         self._cancel_snooze_item = rumps.MenuItem("取消延后", self._handle_cancel_snooze)
-        self._snooze_menu.add(self._snooze_5)
-        self._snooze_menu.add(self._snooze_15)
-        self._snooze_menu.add(self._snooze_30)
         self._snooze_menu.add(self._cancel_snooze_item)
+        # 提供方在构造后不会变化，未配置的功能在此一次性禁用菜单回调
+        if flow_state_provider is None:
+            self._flow_menu_item.set_callback(None)
+        if snooze_state_provider is None:
+            for item in (*self._snooze_items, self._cancel_snooze_item):
+                item.set_callback(None)
         self._settings_item = rumps.MenuItem("提醒设置…", self._handle_open_settings)
         self._refresh_item = rumps.MenuItem("刷新久坐计时", self._handle_manual_refresh)
+        self._state_item = rumps.MenuItem(title="当前状态", callback=None)
+        self._focus_item = rumps.MenuItem(title="专注指数", callback=None)
+        self._seat_item = rumps.MenuItem(title="在座/休息", callback=None)
+        self._next_reminder_item = rumps.MenuItem(title="下一次提醒", callback=None)
         self.menu = [
-            rumps.MenuItem(title="当前状态", callback=None),
-            rumps.MenuItem(title="专注指数", callback=None),
-            rumps.MenuItem(title="在座/休息", callback=None),
-            rumps.MenuItem(title="下一次提醒", callback=None),
+            self._state_item,
+            self._focus_item,
+            self._seat_item,
+            self._next_reminder_item,
             self._refresh_item,
             self._flow_menu_item,
             self._snooze_menu,
             self._settings_item,
             None,
-            rumps.MenuItem("打开仪表盘", callback=self._open_dashboard),
-            rumps.MenuItem("退出", callback=self._quit_app),
+            rumps.MenuItem("打开仪表盘", callback=_open_dashboard_callback),
+            rumps.MenuItem("退出", callback=_quit_callback),
         ]
-        self._poll_timer = rumps.Timer(self._refresh, 2.0)
+        # 快照与提醒在后台线程的事件循环中轮询，结果经 AppHelper.callAfter 回到主线程
+        self._poll_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._poll_wakeup: Optional[asyncio.Event] = None
+        self._polling_paused = False
         self._last_snapshot: Optional[StatusSnapshot] = None
-        if self._on_system_sleep or self._on_system_wake:
-            self._register_power_events()
+        self._last_title: str = self.title
+        self._last_display: dict[str, tuple[str, tuple]] = {}
+        self._last_flow_state: object = None
+        self._last_snooze_state: object = None
+        self._menu_open = False
+        self._menu_delegate_ref = None
+        self._batch_menu = None
+        self._register_power_events()
+        # 后台产生通知时直接唤醒轮询，提醒送达不受轮询间隔影响
+        if bind_notification_wakeup is not None:
+            bind_notification_wakeup(self._wake_poller)
         self._ensure_notification_delegate()
 
     def run(self, *args, **kwargs):  # type: ignore[override]
-        self._poll_timer.start()
+        self._ensure_menu_delegate()
+        self._start_polling()
         super().run(*args, **kwargs)
 
-    def _refresh(self, _timer: rumps.Timer) -> None:
-        snapshot = self._snapshot_provider()
-        if snapshot is None:
+    def _start_polling(self) -> None:
+        if AppHelper is None:  # pragma: no cover - 非 GUI 环境无需轮询
             return
+        thread = threading.Thread(target=self._run_poll_loop, name="upclock-status-poll", daemon=True)
+        thread.start()
+
+    def _run_poll_loop(self) -> None:
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self._poll_providers())
+        finally:
+            loop.close()
+
+    async def _poll_providers(self) -> None:
+        """后台轮询提供方，避免其阻塞时冻结状态栏主线程。"""
+
+        wakeup = asyncio.Event()
+        self._poll_wakeup = wakeup
+        self._poll_loop = asyncio.get_running_loop()
+        interval = _POLL_INTERVAL_IMMINENT
+        posted: Optional[StatusSnapshot] = None
+        while True:
+            if not self._polling_paused:
+                try:
+                    snapshot = self._snapshot_provider()
+                    notification = self._notification_provider() if snapshot is not None else None
+                except Exception:
+                    rumps.logger.error("读取状态快照失败", exc_info=True)
+                else:
+                    if snapshot is not None:
+                        interval = self._poll_interval_for(snapshot)
+                        # 快照未变且没有新提醒时不必回到主线程
+                        if notification is not None or not (snapshot is posted or snapshot == posted):
+                            posted = snapshot
+                            AppHelper.callAfter(self._apply_snapshot, snapshot, notification)
+
+            # 休眠期间不设超时，直到唤醒或菜单展开时被 _wake_poller 叫醒
+            try:
+                await asyncio.wait_for(wakeup.wait(), None if self._polling_paused else interval)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
 
+    def _wake_poller(self) -> None:
+        """从主线程唤醒后台轮询，立即读取一次最新快照。"""
+
+        loop, wakeup = self._poll_loop, self._poll_wakeup
+        if loop is None or wakeup is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(wakeup.set)
+
+    def _apply_snapshot(self, snapshot: StatusSnapshot, notification: Optional[NotificationMessage]) -> None:
         self._last_snapshot = snapshot
-        self.title = self._title_for_state(snapshot.state)
-        state_name = self._state_label(snapshot.state)
-        self.menu["当前状态"].title = f"状态：{state_name}"
+        status_title = self._title_for_state(snapshot.state)
+        if status_title != self._last_title:
+            self.title = status_title
+            self._last_title = status_title
+        # 菜单收起时只更新图标，菜单内容留到 menuWillOpen 时再渲染
+        if self._menu_open:
+            self._render_menu(snapshot)
+
+        if notification is not None:
+            self._show_notification(notification)
+
+    def _render_menu(self, snapshot: StatusSnapshot) -> None:
+        # 批量写入期间暂停 NSMenu 的变更通知，恢复后由 AppKit 合并为一次重绘
+        nsmenu = self._batch_menu
+        if nsmenu is None:
+            self._render_menu_items(snapshot)
+            return
+        nsmenu.setMenuChangedMessagesEnabled_(False)
+        try:
+            self._render_menu_items(snapshot)
+        finally:
+            nsmenu.setMenuChangedMessagesEnabled_(True)
+
+    def _render_menu_items(self, snapshot: StatusSnapshot) -> None:
+        self._set_menu_title("state", self._state_item, _TMPL_STATE, (self._state_label(snapshot.state),))
         focus_percent = max(0.0, min(100.0, snapshot.score * 100.0))
-        self.menu["专注指数"].title = f"专注指数：{focus_percent:.0f}%"
-        self.menu["在座/休息"].title = f"在座：{snapshot.seated_minutes:.1f} 分钟 / 休息：{snapshot.break_minutes:.1f}"
-        if "下一次提醒" in self.menu:
-            if snapshot.quiet_minutes is not None:
-                label = f"静默中：{max(0.0, snapshot.quiet_minutes):.1f} 分"
-            elif snapshot.snooze_minutes is not None:
-                label = f"延后：{max(0.0, snapshot.snooze_minutes):.1f} 分"
-            elif snapshot.flow_mode_minutes is not None:
-                label = f"心流：{max(0.0, snapshot.flow_mode_minutes):.1f} 分"
-            elif snapshot.next_reminder_minutes is not None:
-                label = f"下一次提醒：{max(0.0, snapshot.next_reminder_minutes):.1f} 分"
-            else:
-                label = "下一次提醒：--"
-            self.menu["下一次提醒"].title = label
+        self._set_menu_title("focus", self._focus_item, _TMPL_FOCUS, (round(focus_percent),))
+        self._set_menu_title(
+            "seat",
+            self._seat_item,
+            _TMPL_SEAT,
+            (round(snapshot.seated_minutes, 1), round(snapshot.break_minutes, 1)),
+        )
+        if snapshot.quiet_minutes is not None:
+            template, minutes = _TMPL_QUIET, snapshot.quiet_minutes
+        elif snapshot.snooze_minutes is not None:
+            template, minutes = _TMPL_SNOOZE, snapshot.snooze_minutes
+        elif snapshot.flow_mode_minutes is not None:
+            template, minutes = _TMPL_FLOW, snapshot.flow_mode_minutes
+        elif snapshot.next_reminder_minutes is not None:
+            template, minutes = _TMPL_NEXT, snapshot.next_reminder_minutes
+        else:
+            template, minutes = _TEXT_NEXT_NONE, None
+        values = () if minutes is None else (round(max(0.0, minutes), 1),)
+        self._set_menu_title("next", self._next_reminder_item, template, values)
         self._update_flow_menu(snapshot.flow_mode_minutes)
         self._update_snooze_menu(snapshot.snooze_minutes)
 
-        notification = self._notification_provider()
-        if notification is not None:
-            self._show_notification(notification)
+    def _set_menu_title(self, key: str, item: rumps.MenuItem, template: str, values: tuple) -> None:
+        """按模板与取整后的数值写入菜单项，两者都未变化时跳过格式化与 PyObjC 调用。"""
+
+        display = (template, values)
+        if self._last_display.get(key) == display:
+            return
+        item.title = template % values if values else template
+        self._last_display[key] = display
+
+    def _poll_interval_for(self, snapshot: StatusSnapshot) -> float:
+        """根据下一次提醒的剩余时间与菜单是否展开选择轮询间隔。"""
+
+        remaining = snapshot.next_reminder_minutes
+        if remaining is not None and remaining < _REMINDER_IMMINENT_MINUTES:
+            return _POLL_INTERVAL_IMMINENT
+        if self._menu_open or (remaining is not None and remaining < _REMINDER_NEAR_MINUTES):
+            return _POLL_INTERVAL_NEAR
+        # 菜单收起且提醒尚远时只需维持图标状态，按分钟级低频轮询，并对齐整分以便系统合并唤醒
+        delay = _POLL_INTERVAL_BACKGROUND - time.time() % _POLL_INTERVAL_BACKGROUND
+        if delay < _MINUTE_ALIGN_MIN_SECONDS:
+            delay += _POLL_INTERVAL_BACKGROUND
+        return delay
 
     def _title_for_state(self, state: Optional[ActivityState]) -> str:
-        if state is ActivityState.PROLONGED_SEATED:
-            return "💥"
-        if state is ActivityState.SHORT_BREAK:
-            return "☕"
-        return "👨🏻‍💻"
+        return _TITLE_FOR_STATE.get(state, _DEFAULT_STATUS_TITLE)  # type: ignore[arg-type]
 
     def _show_notification(self, message: NotificationMessage) -> None:
+        # 同一提醒在冷却窗口内重复出现时不再投递，也不再弹跳图标
+        now = time.monotonic()
+        if message == self._last_notification and now - self._last_notification_at < _NOTIFICATION_REPEAT_SUPPRESS_SECONDS:
+            return
+        self._last_notification = message
+        self._last_notification_at = now
+
         delivered = self._deliver_user_notification(message)
         if not delivered:
             rumps.notification(message.title, message.subtitle, message.body)
         self._bounce_icon()
         if not delivered:
-            self._show_transient_banner(message.body)
+            self._queue_transient_banner(message.body)
 
     def _deliver_user_notification(self, message: NotificationMessage) -> bool:
         if NSUserNotificationCenter is None or NSUserNotification is None:
             return False
         try:
-            center = NSUserNotificationCenter.defaultUserNotificationCenter()
-            notification = NSUserNotification.alloc().init()
-            title = message.title or "upClock 提醒"
-            notification.setTitle_(title)
-            if message.subtitle:
-                notification.setSubtitle_(message.subtitle)
-            body = message.body or ""
-            notification.setInformativeText_(body)
-            if NSUserNotificationDefaultSoundName is not None:
-                notification.setSoundName_(NSUserNotificationDefaultSoundName)
-            else:
-                notification.setSoundName_("NSUserNotificationDefaultSoundName")
-            identifier = f"upclock-{time.time()}"
-            if hasattr(notification, "setIdentifier_"):
-                notification.setIdentifier_(identifier)
-            if hasattr(notification, "setHasActionButton_"):
-                notification.setHasActionButton_(False)
-            center.deliverNotification_(notification)
+            if self._reusable_notification is None:
+                self._reusable_notification = self._new_user_notification()
+            self._post_user_notification(self._reusable_notification, message)
+            return True
+        except Exception:
+            rumps.logger.debug("复用系统通知失败，改用新实例", exc_info=True)
+            self._reusable_notification = None
+        try:
+            self._post_user_notification(self._new_user_notification(), message)
             return True
         except Exception:
             rumps.logger.error("系统通知发送失败", exc_info=True)
             return False
 
+    @staticmethod
+    def _new_user_notification():  # type: ignore[no-untyped-def]
+        """创建通知实例，并写入每次投递都不变的属性。"""
+
+        notification = NSUserNotification.alloc().init()
+        if NSUserNotificationDefaultSoundName is not None:
+            notification.setSoundName_(NSUserNotificationDefaultSoundName)
+        else:
+            notification.setSoundName_("NSUserNotificationDefaultSoundName")
+        if _NOTIFICATION_HAS_ACTION_BUTTON:
+            notification.setHasActionButton_(False)
+        return notification
+
+    @staticmethod
+    def _post_user_notification(notification, message: NotificationMessage) -> None:  # type: ignore[no-untyped-def]
+        notification.setTitle_(message.title or "upClock 提醒")
+        notification.setSubtitle_(message.subtitle or None)
+        notification.setInformativeText_(message.body or "")
+        if _NOTIFICATION_HAS_IDENTIFIER:
+            notification.setIdentifier_(_NOTIFICATION_ID_PREFIX + str(next(_NOTIFICATION_IDS)))
+        NSUserNotificationCenter.defaultUserNotificationCenter().deliverNotification_(notification)
+
     def _state_label(self, state: Optional[ActivityState]) -> str:
-        mapping = {
-            ActivityState.ACTIVE: "活跃",
-            ActivityState.SHORT_BREAK: "短暂休息",
-            ActivityState.PROLONGED_SEATED: "久坐",
-        }
         if state is None:
             return "未知"
-        return mapping.get(state, state.name)
-
-    def _open_dashboard(self, _sender: rumps.MenuItem) -> None:
-        import webbrowser
-
-        webbrowser.open("http://127.0.0.1:8000/")
-
-    def _quit_app(self, _sender: rumps.MenuItem) -> None:
-        rumps.quit_application()
+        return _STATE_LABEL.get(state, state.name)
 
     def _bounce_icon(self) -> None:
         if NSApp is None:  # pragma: no cover - 非 GUI 环境无需处理
@@ -339,10 +690,36 @@ class StatusBarApp(rumps.App):
         except Exception:  # pragma: no cover - rumps 版本不支持事件
             return
 
-        if self._on_system_sleep is not None:
-            events.on_sleep(self._handle_system_sleep)
-        if self._on_system_wake is not None:
-            events.on_wake(self._handle_system_wake)
+        # 即便没有外部回调也需要监听，用于在休眠期间暂停轮询
+        events.on_sleep(self._handle_system_sleep)
+        events.on_wake(self._handle_system_wake)
+
+    def _ensure_menu_delegate(self) -> None:
+        if _StatusMenuDelegate is None or self._menu_delegate_ref is not None:
+            return
+        try:
+            nsmenu = self._menu._menu
+            delegate = _StatusMenuDelegate.alloc().initWithApp_(self)
+            nsmenu.setDelegate_(delegate)
+            self._menu_delegate_ref = delegate
+            if hasattr(nsmenu, "setMenuChangedMessagesEnabled_"):
+                self._batch_menu = nsmenu
+        except Exception:  # pragma: no cover - 设置失败时退回到每次刷新菜单
+            rumps.logger.debug("菜单代理设置失败", exc_info=True)
+            self._menu_open = True
+
+    def _handle_menu_will_open(self) -> None:
+        self._menu_open = True
+        # 先用已有快照立即渲染，再唤醒后台取最新数据
+        if self._last_snapshot is not None:
+            try:
+                self._render_menu(self._last_snapshot)
+            except Exception:  # pragma: no cover - 渲染失败不影响菜单展示
+                rumps.logger.debug("菜单展开时渲染失败", exc_info=True)
+        self._wake_poller()
+
+    def _handle_menu_did_close(self) -> None:
+        self._menu_open = False
 
     def _ensure_notification_delegate(self) -> None:
         if NSUserNotificationCenter is None or _NotificationCenterDelegate is None:
@@ -359,41 +736,56 @@ class StatusBarApp(rumps.App):
 
     def _update_flow_menu(self, remaining: Optional[float]) -> None:
         if self._flow_state_provider is None:
+            if self._last_flow_state is _MENU_UNCONFIGURED:
+                return
+            self._last_flow_state = _MENU_UNCONFIGURED
             self._flow_menu_item.title = "心流模式：未配置"
-            self._flow_menu_item.set_callback(None)
             return
 
-        self._flow_menu_item.set_callback(self._handle_flow_mode)
         active, provider_remaining = self._flow_state_provider()
         minutes = remaining if remaining is not None else provider_remaining
         if active:
-            minutes = max(minutes, 0.0)
+            minutes = round(max(minutes, 0.0), 1)
+        state = (active, minutes if active else None)
+        if state == self._last_flow_state:
+            return
+        self._last_flow_state = state
+
+        if active:
             self._flow_menu_item.title = f"心流模式：剩余 {minutes:.1f} 分"
         else:
             self._flow_menu_item.title = "开启心流模式…"
 
     def _update_snooze_menu(self, remaining: Optional[float]) -> None:
         if self._snooze_state_provider is None:
+            if self._last_snooze_state is _MENU_UNCONFIGURED:
+                return
+            self._last_snooze_state = _MENU_UNCONFIGURED
             self._snooze_menu.title = "延后提醒：未配置"
-            for item in (self._snooze_5, self._snooze_15, self._snooze_30, self._cancel_snooze_item):
-                item.set_callback(None)
             return
 
-        self._snooze_5.set_callback(lambda _: self._handle_snooze(5))
-        self._snooze_15.set_callback(lambda _: self._handle_snooze(15))
-        self._snooze_30.set_callback(lambda _: self._handle_snooze(30))
-
         active, provider_remaining = self._snooze_state_provider()
         minutes = remaining if remaining is not None else provider_remaining
         if active:
-            minutes = max(minutes, 0.0)
+            minutes = round(max(minutes, 0.0), 1)
+        state = (active, minutes if active else None)
+        previous = self._last_snooze_state
+        if state == previous:
+            return
+        self._last_snooze_state = state
+
+        if active:
             self._snooze_menu.title = f"延后提醒：剩余 {minutes:.1f} 分"
-            self._cancel_snooze_item.title = "取消延后"
-            self._cancel_snooze_item.set_callback(self._handle_cancel_snooze)
         else:
             self._snooze_menu.title = "延后提醒"
-            self._cancel_snooze_item.title = "取消延后 (无)"
-            self._cancel_snooze_item.set_callback(lambda _: None)
+        # 取消项只随延后的开启/结束切换，剩余时间变化时无需重新接线
+        if previous is None or previous[0] != active:
+            if active:
+                self._cancel_snooze_item.title = "取消延后"
+                self._cancel_snooze_item.set_callback(self._handle_cancel_snooze)
+            else:
+                self._cancel_snooze_item.title = "取消延后 (无)"
+                self._cancel_snooze_item.set_callback(_ignore_menu_click)
 
     def _handle_flow_mode(self, _sender: rumps.MenuItem) -> None:
         if self._flow_state_provider is None:
@@ -404,11 +796,7 @@ class StatusBarApp(rumps.App):
         if active:
             if self._cancel_flow_mode is None:
                 return
-            if self._confirm_end_flow_mode(remaining):
-                try:
-                    self._cancel_flow_mode()
-                except Exception:
-                    rumps.alert("操作失败", "无法结束心流模式，请查看日志。")
+            self._confirm_end_flow_mode(remaining, self._end_flow_mode)
             return
 
         if self._activate_flow_mode is None:
@@ -422,6 +810,17 @@ class StatusBarApp(rumps.App):
         except Exception:
             rumps.alert("操作失败", "无法开启心流模式，请查看日志。")
 
+    def _end_flow_mode(self) -> None:
+        if self._cancel_flow_mode is None:
+            return
+        try:
+            self._cancel_flow_mode()
+        except Exception:
+            rumps.alert("操作失败", "无法结束心流模式，请查看日志。")
+
+    def _handle_snooze_menu(self, sender: rumps.MenuItem) -> None:
+        self._handle_snooze(getattr(sender, "_snooze_minutes", _SNOOZE_OPTIONS[0]))
+
     def _handle_snooze(self, minutes: float) -> None:
         if self._activate_snooze is None:
             rumps.alert("未配置延后提醒", "当前版本未提供延后提醒控制。")
@@ -465,6 +864,7 @@ class StatusBarApp(rumps.App):
             return
         try:
             self._refresh_callback()
+            self._wake_poller()
             rumps.notification("久坐计时已刷新", "", "重新开始统计在座时长。")
         except Exception:
             rumps.alert("操作失败", "无法刷新久坐计时，请查看日志。")
@@ -477,99 +877,21 @@ class StatusBarApp(rumps.App):
             alert.addButtonWithTitle_("保存")
             alert.addButtonWithTitle_("取消")
 
-            width = 280.0
-            height = 220.0
-            container = NSView.alloc().initWithFrame_(NSMakeRect(0.0, 0.0, width, height))
-
-            def make_label(text: str, y: float, alignment: int = 0) -> NSTextField:
-                label = NSTextField.alloc().initWithFrame_(NSMakeRect(0.0, y, width, 18.0))
-                label.setStringValue_(text)
-                label.setEditable_(False)
-                label.setBordered_(False)
-                label.setBezeled_(False)
-                label.setDrawsBackground_(False)
-                label.setAlignment_(alignment)
-                return label
-
-            def make_value_label(y: float, value: float) -> NSTextField:
-                value_label = NSTextField.alloc().initWithFrame_(NSMakeRect(0.0, y, width, 22.0))
-                value_label.setStringValue_(f"{value:.0f} 分钟")
-                value_label.setEditable_(False)
-                value_label.setBordered_(False)
-                value_label.setBezeled_(False)
-                value_label.setDrawsBackground_(False)
-                value_label.setAlignment_(1)
-                return value_label
-
-            prolonged_value = max(15.0, min(240.0, float(current.prolonged_seated_minutes)))
-            cooldown_value = max(5.0, min(120.0, float(current.notification_cooldown_minutes)))
-
-            prolonged_label = make_label("久坐阈值 (分钟)：", 192.0)
-            prolonged_value_label = make_value_label(168.0, prolonged_value)
-
-            prolonged_slider = NSSlider.alloc().initWithFrame_(NSMakeRect(0.0, 136.0, width, 24.0))
-            prolonged_slider.setMinValue_(15.0)
-            prolonged_slider.setMaxValue_(240.0)
-            prolonged_slider.setDoubleValue_(prolonged_value)
-            prolonged_slider.setNumberOfTickMarks_(46)
-            prolonged_slider.setAllowsTickMarkValuesOnly_(True)
-            prolonged_slider.setContinuous_(True)
-
-            cooldown_label = make_label("提醒冷却 (分钟)：", 112.0)
-            cooldown_value_label = make_value_label(88.0, cooldown_value)
-
-            cooldown_slider = NSSlider.alloc().initWithFrame_(NSMakeRect(0.0, 56.0, width, 24.0))
-            cooldown_slider.setMinValue_(5.0)
-            cooldown_slider.setMaxValue_(120.0)
-            cooldown_slider.setDoubleValue_(cooldown_value)
-            cooldown_slider.setNumberOfTickMarks_(24)
-            cooldown_slider.setAllowsTickMarkValuesOnly_(True)
-            cooldown_slider.setContinuous_(True)
-
-            quiet_field = NSTextField.alloc().initWithFrame_(NSMakeRect(0.0, 16.0, width, 22.0))
-            quiet_str = ", ".join(f"{start}-{end}" for start, end in current.quiet_hours)
-            quiet_field.setStringValue_(quiet_str)
-            quiet_field.setPlaceholderString_("例如 22:00-07:00, 12:30-13:30")
-            quiet_field.setEditable_(True)
-            quiet_field.setBezeled_(True)
-            quiet_field.setBordered_(True)
-            quiet_field.setDrawsBackground_(True)
-
-            container.addSubview_(prolonged_label)
-            container.addSubview_(prolonged_value_label)
-            container.addSubview_(prolonged_slider)
-            container.addSubview_(cooldown_label)
-            container.addSubview_(cooldown_value_label)
-            container.addSubview_(cooldown_slider)
-            container.addSubview_(make_label("静默时段 (逗号分隔)：", 40.0))
-            container.addSubview_(quiet_field)
-
-            if _FlowSliderDelegate is not None:
-                prolonged_delegate = _FlowSliderDelegate.alloc().initWithLabel_(prolonged_value_label)
-                prolonged_slider.setTarget_(prolonged_delegate)
-                prolonged_slider.setAction_(objc.selector(_FlowSliderDelegate.sliderChanged_, signature=b"v@:@"))
-                prolonged_delegate.sliderChanged_(prolonged_slider)
-                cooldown_delegate = _FlowSliderDelegate.alloc().initWithLabel_(cooldown_value_label)
-                cooldown_slider.setTarget_(cooldown_delegate)
-                cooldown_slider.setAction_(objc.selector(_FlowSliderDelegate.sliderChanged_, signature=b"v@:@"))
-                cooldown_delegate.sliderChanged_(cooldown_slider)
-                try:
-                    objc.setAssociatedObject(
-                        prolonged_slider,
-                        b"_upclock_settings_prolonged_delegate",
-                        prolonged_delegate,
-                        getattr(objc, "OBJC_ASSOCIATION_RETAIN", 0),
-                    )
-                    objc.setAssociatedObject(
-                        cooldown_slider,
-                        b"_upclock_settings_cooldown_delegate",
-                        cooldown_delegate,
-                        getattr(objc, "OBJC_ASSOCIATION_RETAIN", 0),
-                    )
-                except Exception:
-                    pass
-
-            alert.setAccessoryView_(container)
+            accessory = self._settings_accessory
+            if accessory is None:
+                accessory = self._settings_accessory = self._build_settings_accessory()
+
+            prolonged_slider = accessory.prolonged_slider
+            cooldown_slider = accessory.cooldown_slider
+            quiet_field = accessory.quiet_field
+            prolonged_slider.setDoubleValue_(max(15.0, min(240.0, float(current.prolonged_seated_minutes))))
+            cooldown_slider.setDoubleValue_(max(5.0, min(120.0, float(current.notification_cooldown_minutes))))
+            quiet_field.setStringValue_(", ".join(f"{start}-{end}" for start, end in current.quiet_hours))
+            if accessory.prolonged_delegate is not None:
+                accessory.prolonged_delegate.sliderChanged_(prolonged_slider)
+                accessory.cooldown_delegate.sliderChanged_(cooldown_slider)
+
+            alert.setAccessoryView_(accessory.container)
             window = alert.window()
             if window is not None:
                 window.setInitialFirstResponder_(quiet_field)
@@ -638,26 +960,90 @@ class StatusBarApp(rumps.App):
             quiet_hours=quiet_slots,
         )
 
+    def _build_settings_accessory(self) -> _SettingsAccessory:
+        container = NSView.alloc().initWithFrame_(_SETTINGS_CONTAINER_FRAME)
+
+        def make_label(text: str, frame: tuple, alignment: int = 0) -> NSTextField:
+            label = NSTextField.alloc().initWithFrame_(frame)
+            label.setStringValue_(text)
+            label.setEditable_(False)
+            label.setBordered_(False)
+            label.setBezeled_(False)
+            label.setDrawsBackground_(False)
+            label.setAlignment_(alignment)
+            return label
+
+        def make_value_label(frame: tuple) -> NSTextField:
+            value_label = NSTextField.alloc().initWithFrame_(frame)
+            value_label.setEditable_(False)
+            value_label.setBordered_(False)
+            value_label.setBezeled_(False)
+            value_label.setDrawsBackground_(False)
+            value_label.setAlignment_(1)
+            return value_label
+
+        prolonged_label = make_label("久坐阈值 (分钟)：", _SETTINGS_PROLONGED_LABEL_FRAME)
+        prolonged_value_label = make_value_label(_SETTINGS_PROLONGED_VALUE_FRAME)
+
+        prolonged_slider = NSSlider.alloc().initWithFrame_(_SETTINGS_PROLONGED_SLIDER_FRAME)
+        prolonged_slider.setMinValue_(15.0)
+        prolonged_slider.setMaxValue_(240.0)
+        prolonged_slider.setNumberOfTickMarks_(46)
+        prolonged_slider.setAllowsTickMarkValuesOnly_(True)
+        prolonged_slider.setContinuous_(True)
+
+        cooldown_label = make_label("提醒冷却 (分钟)：", _SETTINGS_COOLDOWN_LABEL_FRAME)
+        cooldown_value_label = make_value_label(_SETTINGS_COOLDOWN_VALUE_FRAME)
+
+        cooldown_slider = NSSlider.alloc().initWithFrame_(_SETTINGS_COOLDOWN_SLIDER_FRAME)
+        cooldown_slider.setMinValue_(5.0)
+        cooldown_slider.setMaxValue_(120.0)
+        cooldown_slider.setNumberOfTickMarks_(24)
+        cooldown_slider.setAllowsTickMarkValuesOnly_(True)
+        cooldown_slider.setContinuous_(True)
+
+        quiet_field = NSTextField.alloc().initWithFrame_(_SETTINGS_QUIET_FIELD_FRAME)
+        quiet_field.setPlaceholderString_("例如 22:00-07:00, 12:30-13:30")
+        quiet_field.setEditable_(True)
+        quiet_field.setBezeled_(True)
+        quiet_field.setBordered_(True)
+        quiet_field.setDrawsBackground_(True)
+
+        container.addSubview_(prolonged_label)
+        container.addSubview_(prolonged_value_label)
+        container.addSubview_(prolonged_slider)
+        container.addSubview_(cooldown_label)
+        container.addSubview_(cooldown_value_label)
+        container.addSubview_(cooldown_slider)
+        container.addSubview_(make_label("静默时段 (逗号分隔)：", _SETTINGS_QUIET_LABEL_FRAME))
+        container.addSubview_(quiet_field)
+
+        # 委托由缓存的 accessory 持有引用，防止被 GC
+        prolonged_delegate = cooldown_delegate = None
+        if _FlowSliderDelegate is not None:
+            prolonged_delegate = _FlowSliderDelegate.alloc().initWithLabel_(prolonged_value_label)
+            prolonged_slider.setTarget_(prolonged_delegate)
+            prolonged_slider.setAction_(_SLIDER_CHANGED_SEL)
+            cooldown_delegate = _FlowSliderDelegate.alloc().initWithLabel_(cooldown_value_label)
+            cooldown_slider.setTarget_(cooldown_delegate)
+            cooldown_slider.setAction_(_SLIDER_CHANGED_SEL)
+
+        return _SettingsAccessory(
+            container=container,
+            prolonged_slider=prolonged_slider,
+            cooldown_slider=cooldown_slider,
+            quiet_field=quiet_field,
+            prolonged_delegate=prolonged_delegate,
+            cooldown_delegate=cooldown_delegate,
+        )
+
     def _parse_quiet_input(self, text: str) -> Optional[list[tuple[str, str]]]:
-        text = text.strip()
-        if not text:
-            return []
-        pairs: list[tuple[str, str]] = []
-        for raw in text.split(","):
-            part = raw.strip()
-            if not part:
-                continue
-            if "-" not in part:
-                return None
-            start, end = part.split("-", 1)
-            start = start.strip()
-            end = end.strip()
-            if not start or not end:
-                return None
-            pairs.append((start, end))
-        return pairs
+        if _QUIET_INPUT_RE.fullmatch(text) is None:
+            return None
+        return _QUIET_PAIR_RE.findall(text)
 
     def _handle_system_sleep(self, *_args, **_kwargs) -> None:
+        self._polling_paused = True
         if self._on_system_sleep is not None:
             try:
                 self._on_system_sleep()
@@ -670,6 +1056,9 @@ class StatusBarApp(rumps.App):
                 self._on_system_wake()
             except Exception:  # pragma: no cover
                 rumps.logger.error("处理系统唤醒事件失败", exc_info=True)
+        # 恢复轮询并立即补一次刷新
+        self._polling_paused = False
+        self._wake_poller()
 
     def _prompt_flow_duration(self, default_minutes: float = 60.0) -> Optional[float]:
         """弹出紧凑窗口询问心流模式时长。"""
@@ -681,45 +1070,14 @@ class StatusBarApp(rumps.App):
             alert.addButtonWithTitle_("开始")
             alert.addButtonWithTitle_("取消")
 
-            width = 220.0
-            container = NSView.alloc().initWithFrame_(NSMakeRect(0.0, 0.0, width, 70.0))
+            accessory = self._flow_accessory
+            if accessory is None:
+                accessory = self._flow_accessory = self._build_flow_accessory()
 
-            value_label = NSTextField.alloc().initWithFrame_(NSMakeRect(0.0, 40.0, width, 22.0))
-            value_label.setStringValue_(f"{default_minutes:.0f} 分钟")
-            value_label.setEditable_(False)
-            value_label.setBordered_(False)
-            value_label.setBezeled_(False)
-            value_label.setDrawsBackground_(False)
-            value_label.setAlignment_(1)  # center
-
-            slider = NSSlider.alloc().initWithFrame_(NSMakeRect(0.0, 10.0, width, 24.0))
-            slider.setMinValue_(15.0)
-            slider.setMaxValue_(240.0)
+            slider = accessory.slider
             slider.setDoubleValue_(max(15.0, min(240.0, default_minutes)))
-            slider.setNumberOfTickMarks_(16)
-            slider.setAllowsTickMarkValuesOnly_(True)
-            slider.setContinuous_(True)
-
-            delegate = _FlowSliderDelegate.alloc().initWithLabel_(value_label)
-            slider.setTarget_(delegate)
-            slider.setAction_(objc.selector(_FlowSliderDelegate.sliderChanged_, signature=b"v@:@"))
-            delegate.sliderChanged_(slider)
-            try:  # 保持引用，防止被 GC
-                objc.setAssociatedObject(
-                    slider,
-                    b"_upclock_flow_delegate",
-                    delegate,
-                    getattr(objc, "OBJC_ASSOCIATION_RETAIN", 0),
-                )
-            except Exception:  # pragma: no cover - setAssociatedObject 不可用时忽略
-                pass
-
-            container.setAutoresizesSubviews_(True)
-            slider.setAutoresizingMask_(2)  # width resizing
-
-            container.addSubview_(value_label)
-            container.addSubview_(slider)
-            alert.setAccessoryView_(container)
+            accessory.delegate.sliderChanged_(slider)
+            alert.setAccessoryView_(accessory.container)
 
             response = alert.runModal()
             if response not in (NSAlertFirstButtonReturn, 1, 1000):
@@ -752,71 +1110,187 @@ class StatusBarApp(rumps.App):
 
         return max(1.0, minutes)
 
-    def _confirm_end_flow_mode(self, remaining: float) -> bool:
-        """确认是否结束心流模式。"""
+    def _build_flow_accessory(self) -> _FlowAccessory:
+        container = NSView.alloc().initWithFrame_(_FLOW_CONTAINER_FRAME)
 
-        confirm = rumps.alert(
-            "结束心流模式",
-            f"心流模式剩余 {remaining:.1f} 分钟，是否提前结束？",
-            ok="结束",
-            cancel="继续",
-        )
-        return confirm == 1
+        value_label = NSTextField.alloc().initWithFrame_(_FLOW_VALUE_FRAME)
+        value_label.setEditable_(False)
+        value_label.setBordered_(False)
+        value_label.setBezeled_(False)
+        value_label.setDrawsBackground_(False)
+        value_label.setAlignment_(1)  # center
+
+        slider = NSSlider.alloc().initWithFrame_(_FLOW_SLIDER_FRAME)
+        slider.setMinValue_(15.0)
+        slider.setMaxValue_(240.0)
+        slider.setNumberOfTickMarks_(16)
+        slider.setAllowsTickMarkValuesOnly_(True)
+        slider.setContinuous_(True)
+
+        delegate = _FlowSliderDelegate.alloc().initWithLabel_(value_label)
+        slider.setTarget_(delegate)
+        slider.setAction_(_SLIDER_CHANGED_SEL)
+
+        container.setAutoresizesSubviews_(True)
+        slider.setAutoresizingMask_(2)  # width resizing
+
+        container.addSubview_(value_label)
+        container.addSubview_(slider)
+        return _FlowAccessory(container=container, slider=slider, delegate=delegate)
+
+    def _confirm_end_flow_mode(self, remaining: float, on_confirm: Callable[[], None]) -> None:
+        """确认是否结束心流模式，用户选择“结束”后调用 ``on_confirm``。
+
+        默认在状态栏图标下弹出非模态确认框，不阻塞主线程；
+        无法弹出或设置了 UPCLOCK_SYNC_DIALOGS 时退回模态的 rumps.alert。
+        """
+
+        message = f"心流模式剩余 {remaining:.1f} 分钟，是否提前结束？"
+        if not os.environ.get(_SYNC_DIALOGS_ENV) and self._show_confirm_popover(message, on_confirm):
+            return
+
+        confirm = rumps.alert("结束心流模式", message, ok="结束", cancel="继续")
+        if confirm == 1:
+            on_confirm()
+
+    def _show_confirm_popover(self, message: str, on_confirm: Callable[[], None]) -> bool:
+        if _ConfirmPopoverController is None:
+            return False
+        button = self._status_button or self._probe_status_button()
+        if button is None:
+            return False
+
+        try:
+            popover, controller = self._confirm_popover, self._confirm_controller
+            if popover is None or controller is None:
+                controller = _ConfirmPopoverController.alloc().init()
+                popover = NSPopover.alloc().init()
+                popover.setContentViewController_(controller)
+                popover.setAnimates_(True)
+                if NSPopoverBehaviorTransient:
+                    popover.setBehavior_(NSPopoverBehaviorTransient)
+                self._confirm_popover, self._confirm_controller = popover, controller
+            controller.configure(popover, message, on_confirm)
+            if not popover.isShown():
+                popover.showRelativeToRect_ofView_preferredEdge_(button.bounds(), button, NSMaxYEdge)
+        except Exception:  # pragma: no cover - GUI 相关异常时退回模态对话框
+            rumps.logger.debug("确认弹窗显示失败", exc_info=True)
+            return False
+        return True
+
+    def _queue_transient_banner(self, text: str) -> None:
+        """暂存横幅文本，待防抖窗口结束后统一展示。"""
+
+        self._pending_banner.append(text)
+        if self._banner_debounce_timer.is_alive():
+            return
+        self._banner_flush_at = time.monotonic() + _BANNER_DEBOUNCE_SECONDS
+        self._banner_debounce_timer.start()
+
+    def _flush_banner(self, _timer: Optional[rumps.Timer] = None) -> None:
+        # rumps.Timer 启动后会立即触发一次，未到防抖时间则等待下一次
+        if time.monotonic() < self._banner_flush_at:
+            return
+        self._banner_debounce_timer.stop()
+
+        pending, self._pending_banner = self._pending_banner, []
+        if not pending:
+            return
+        if len(pending) == 1:
+            text = pending[0]
+        else:
+            text = f"{len(pending)} 条提醒：" + "；".join(pending)
+
+        now = time.monotonic()
+        if text == self._last_banner_text and now - self._last_banner_at < _BANNER_REPEAT_SUPPRESS_SECONDS:
+            return
+        self._last_banner_text = text
+        self._last_banner_at = now
+        self._show_transient_banner(text)
 
     def _show_transient_banner(self, text: str) -> None:
         """在状态栏图标下方短暂展示提醒文本。"""
 
-        if NSPopover is None or NSViewController is None or objc is None:
+        if self._banner_supported is False:
             return
 
+        button = self._status_button
+        if button is None:
+            button = self._probe_status_button()
+            if button is None:
+                return
+
+        self._close_transient_banner()
+
+        try:
+            popover = self._ensure_banner_popover(text)
+            popover.showRelativeToRect_ofView_preferredEdge_(button.bounds(), button, NSMaxYEdge)
+            self._banner_close_at = time.monotonic() + _BANNER_DISPLAY_SECONDS
+            self._banner_timer.start()
+        except Exception:  # pragma: no cover - GUI 相关异常直接忽略
+            rumps.logger.debug("短暂通知显示失败", exc_info=True)
+
+    def _probe_status_button(self):  # type: ignore[no-untyped-def]
+        """探测状态栏按钮；确认不支持时记下结果，后续横幅直接跳过。"""
+
+        if NSPopover is None or NSViewController is None or objc is None:
+            self._banner_supported = False
+            return None
+
+        # 应用尚未 run 时 _nsapp 还不存在，此时不缓存结论
         status_app = getattr(self, "_nsapp", None)
         if status_app is None:
-            return
+            return None
 
         status_item = getattr(status_app, "nsstatusitem", None)
         if status_item is None:
-            return
+            return None
 
-        button = None
         try:
             button = status_item.button()
         except Exception:  # pragma: no cover - 旧系统可能没有 button 接口
             button = None
 
         if button is None:
-            return
+            self._banner_supported = False
+            return None
 
-        self._close_transient_banner()
+        self._banner_supported = True
+        self._status_button = button
+        return button
 
+    def _close_transient_banner(self, timer: Optional[rumps.Timer] = None) -> None:
+        # 计时器启动时会立即触发一次，未到展示时长则忽略
+        if timer is not None and time.monotonic() < self._banner_close_at:
+            return
         try:
-            controller = _TransientPopoverController.alloc().initWithMessage_(text)
-            popover = NSPopover.alloc().init()
-            popover.setContentViewController_(controller)
-            popover.setAnimates_(True)
-            if NSPopoverBehaviorTransient:
-                popover.setBehavior_(NSPopoverBehaviorTransient)
-            popover.showRelativeToRect_ofView_preferredEdge_(button.bounds(), button, NSMaxYEdge)
-            self._banner_popover = popover
-            self._banner_timer = rumps.Timer(self._close_transient_banner, 4.0)
-            self._banner_timer.start()
-        except Exception:  # pragma: no cover - GUI 相关异常直接忽略
-            rumps.logger.debug("短暂通知显示失败", exc_info=True)
+            self._banner_timer.stop()
+        except Exception:  # pragma: no cover - Timer 停止失败可忽略
+            rumps.logger.debug("短暂通知计时器停止失败", exc_info=True)
 
-    def _close_transient_banner(self, _timer: Optional[rumps.Timer] = None) -> None:
-        if self._banner_timer is not None:
-            if _timer is None or _timer is not self._banner_timer:
-                try:
-                    self._banner_timer.stop()
-                except Exception:  # pragma: no cover - Timer 停止失败可忽略
-                    rumps.logger.debug("短暂通知计时器停止失败", exc_info=True)
-            self._banner_timer = None
-
-        if self._banner_popover is not None:
+        # 弹窗实例常驻复用，这里只负责收起
+        if self._banner_popover is not None and self._banner_popover.isShown():
             try:
                 self._banner_popover.performClose_(None)
             except Exception:  # pragma: no cover - 关闭失败无需终止程序
                 rumps.logger.debug("短暂通知关闭失败", exc_info=True)
-            self._banner_popover = None
+
+    def _ensure_banner_popover(self, text: str):  # type: ignore[no-untyped-def]
+        """首次使用时创建横幅弹窗，之后仅替换文本。"""
+
+        if self._banner_popover is not None and self._banner_controller is not None:
+            self._banner_controller.setMessage_(text)
+            return self._banner_popover
+
+        controller = _TransientPopoverController.alloc().initWithMessage_(text)
+        popover = NSPopover.alloc().init()
+        popover.setContentViewController_(controller)
+        popover.setAnimates_(True)
+        if NSPopoverBehaviorTransient:
+            popover.setBehavior_(NSPopoverBehaviorTransient)
+        self._banner_controller = controller
+        self._banner_popover = popover
+        return popover
 
 
 def run_status_bar_app(
@@ -833,6 +1307,7 @@ def run_status_bar_app(
     settings_provider: Optional[Callable[[], Optional[UserSettings]]] = None,
     update_settings: Optional[Callable[[UserSettings], None]] = None,
     refresh_callback: Optional[Callable[[], None]] = None,
+    bind_notification_wakeup: Optional[Callable[[Callable[[], None]], None]] = None,
 ) -> None:
     app = StatusBarApp(
         snapshot_provider,
@@ -848,31 +1323,45 @@ def run_status_bar_app(
         settings_provider=settings_provider,
         update_settings=update_settings,
         refresh_callback=refresh_callback,
+        bind_notification_wakeup=bind_notification_wakeup,
     )
     app.run()
 
 
+_INFO_PLIST_READY = False
+# 开发环境运行时补写的最小 Info.plist（二进制格式），打包版本由 setup.py 生成
+_INFO_PLIST_BYTES = plistlib.dumps(
+    {"CFBundleIdentifier": "com.upclock.agent", "CFBundleName": "upClock"},
+    fmt=plistlib.FMT_BINARY,
+)
+
+
 def _ensure_info_plist() -> None:
     """确保可执行目录存在 Info.plist 以支持通知。"""
 
-    executable = Path(sys.executable)
-    plist_path = executable.with_name("Info.plist")
-    if plist_path.exists():
+    global _INFO_PLIST_READY
+    if _INFO_PLIST_READY:
+        return
+    if getattr(sys, "frozen", False):
+        # py2app 打包时已由 setup.py 的 PLIST 生成 Info.plist，无需运行期检查
+        _INFO_PLIST_READY = True
         return
 
-    plist_contents = """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>CFBundleIdentifier</key>
-    <string>com.upclock.agent</string>
-    <key>CFBundleName</key>
-    <string>upClock</string>
-</dict>
-</plist>
-"""
+    plist_path = Path(sys.executable).with_name("Info.plist")
+    # O_EXCL 保证只在文件不存在时创建，省去 exists() 预检，也避免并发启动时重复写入
+    try:
+        fd = os.open(plist_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        _INFO_PLIST_READY = True
+        return
+    except OSError as exc:  # pragma: no cover - IO 失败
+        rumps.logger.warning(f"无法写入 Info.plist: {exc}")
+        return
 
     try:
-        plist_path.write_text(plist_contents, encoding="utf-8")
-    except Exception as exc:  # pragma: no cover - IO 失败
+        os.write(fd, _INFO_PLIST_BYTES)
+        _INFO_PLIST_READY = True
+    except OSError as exc:  # pragma: no cover - IO 失败
         rumps.logger.warning(f"无法写入 Info.plist: {exc}")
+    finally:
+        os.close(fd)
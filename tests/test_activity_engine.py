@@ -2,13 +2,17 @@ import datetime as dt
 
 from upclock.config import AppConfig, WindowCategory
 from upclock.core.activity_engine import ActivityEngine, ActivitySnapshot, ActivityState
-from upclock.core.signal_buffer import SignalBuffer, SignalRecord
+from upclock.core.signal_buffer import SignalBuffer, SignalRecord, to_timestamp_ns
 
 
 def _fixed_now() -> dt.datetime:
     return dt.datetime(2024, 1, 1, 12, 0, 0)
 
 
+def _fixed_now_ns() -> int:
+    return to_timestamp_ns(_fixed_now())
+
+
 def _config() -> AppConfig:
     return AppConfig(
         short_break_minutes=1,
@@ -28,7 +32,7 @@ def test_activity_engine_active_with_recent_events() -> None:
     )
 
     engine = ActivityEngine(buffer, config=_config())
-    engine._now = _fixed_now  # type: ignore[method-assign]
+    engine._now_ns = _fixed_now_ns  # type: ignore[method-assign]
     snapshot = engine.compute_snapshot()
 
     assert snapshot.state is ActivityState.ACTIVE
@@ -48,8 +52,8 @@ def test_activity_engine_prolonged_when_seated_long_time() -> None:
     )
 
     engine = ActivityEngine(buffer, config=_config())
-    engine._seated_started_at = _fixed_now() - dt.timedelta(minutes=10)
-    engine._now = _fixed_now  # type: ignore[method-assign]
+    engine._seated_started_at_ns = to_timestamp_ns(_fixed_now() - dt.timedelta(minutes=10))
+    engine._now_ns = _fixed_now_ns  # type: ignore[method-assign]
     snapshot = engine.compute_snapshot()
 
     assert snapshot.state is ActivityState.PROLONGED_SEATED
@@ -67,7 +71,7 @@ def test_activity_engine_short_break_after_inactivity() -> None:
     )
 
     engine = ActivityEngine(buffer, config=_config())
-    engine._now = _fixed_now  # type: ignore[method-assign]
+    engine._now_ns = _fixed_now_ns  # type: ignore[method-assign]
     snapshot = engine.compute_snapshot()
 
     assert snapshot.state is ActivityState.SHORT_BREAK
@@ -90,8 +94,21 @@ def test_activity_engine_keeps_active_when_vision_uncertain() -> None:
     )
 
     engine = ActivityEngine(buffer, config=_config())
-    engine._now = _fixed_now  # type: ignore[method-assign]
+    engine._now_ns = _fixed_now_ns  # type: ignore[method-assign]
     snapshot = engine.compute_snapshot()
 
     assert snapshot.state is ActivityState.ACTIVE
     assert snapshot.metrics["break_minutes"] < 1
+
+
+def test_activity_snapshot_metric_accessor_defaults() -> None:
+    snapshot = ActivitySnapshot(
+        score=0.5,
+        state=ActivityState.ACTIVE,
+        metrics={"seated_minutes": 3.5, "daily_break_count": 2, "posture_state": "upright"},
+    )
+
+    assert snapshot.metric("seated_minutes") == 3.5
+    assert snapshot.metric("daily_break_count") == 2.0
+    assert snapshot.metric("posture_state", default=-1.0) == -1.0
+    assert snapshot.metric("missing") == 0.0
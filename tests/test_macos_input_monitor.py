@@ -19,3 +19,31 @@ def test_input_monitor_drain_metrics_counts_events() -> None:
     assert metrics["scroll_events"] == 1.0
     assert metrics["total_events"] == 3.0
     assert metrics["keyboard_mouse_activity"] == 3.0
+
+
+def test_input_monitor_drain_metrics_counts_mixed_events() -> None:
+    buffer = SignalBuffer()
+    monitor = MacOSInputMonitor(buffer, poll_interval=0.1)
+
+    events = (
+        [Quartz.kCGEventKeyDown, Quartz.kCGEventKeyUp] * 5
+        + [Quartz.kCGEventFlagsChanged]
+        + [Quartz.kCGEventMouseMoved] * 7
+        + [Quartz.kCGEventLeftMouseDown, Quartz.kCGEventLeftMouseUp, Quartz.kCGEventRightMouseDragged]
+        + [Quartz.kCGEventScrollWheel] * 4
+    )
+    for event_type in events:
+        monitor._handle_event(event_type)
+    monitor._handle_event(Quartz.kCGEventTapDisabledByTimeout)
+
+    metrics = monitor._drain_metrics()
+
+    assert metrics["keyboard_events"] == 11.0
+    assert metrics["mouse_events"] == 10.0
+    assert metrics["scroll_events"] == 4.0
+    assert metrics["total_events"] == 25.0
+    assert metrics["keyboard_mouse_activity"] == 25.0
+
+    empty = monitor._drain_metrics()
+    assert empty["total_events"] == 0.0
+
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import numpy as np
 
 from upclock.adapters.vision.posture_estimator import PostureEstimationConfig
@@ -78,3 +80,21 @@ def test_postprocess_movenet_low_visibility_untracked() -> None:
     assert estimate.presence is False
     assert estimate.posture_state == "untracked"
     assert estimate.posture_score == 0.0
+
+
+def test_select_model_variant_prefers_quantized_sibling(tmp_path: Path) -> None:
+    model = tmp_path / "movenet.onnx"
+    model.write_bytes(b"")
+
+    assert ONNXPoseEstimator._select_model_variant(str(model), ["CPUExecutionProvider"]) == str(model)
+
+    int8_model = tmp_path / "movenet_int8.onnx"
+    int8_model.write_bytes(b"")
+    fp16_model = tmp_path / "movenet_fp16.onnx"
+    fp16_model.write_bytes(b"")
+
+    assert ONNXPoseEstimator._select_model_variant(str(model), ["CPUExecutionProvider"]) == str(int8_model)
+    assert ONNXPoseEstimator._select_model_variant(
+        str(model), ["CoreMLExecutionProvider", "CPUExecutionProvider"]
+    ) == str(fp16_model)
+    assert ONNXPoseEstimator._select_model_variant(str(int8_model), ["CoreMLExecutionProvider"]) == str(int8_model)
@@ -0,0 +1,75 @@
+import datetime as dt
+
+from upclock.core.signal_buffer import SignalBuffer, SignalRecord, activity_value
+
+
+def _start() -> dt.datetime:
+    return dt.datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _brute_force(records: list[SignalRecord], cutoff_ns: int) -> float:
+    return sum(activity_value(record.values) for record in records if record.timestamp_ns >= cutoff_ns)
+
+
+def test_activity_since_matches_brute_force_across_compaction() -> None:
+    maxlen = 8
+    buffer = SignalBuffer(maxlen=maxlen)
+    appended: list[SignalRecord] = []
+
+    for index in range(maxlen * 3 + 5):
+        if index % 4 == 3:
+            values = {"presence_confidence": 0.9}
+        else:
+            values = {"keyboard_mouse_activity": float(index % 7), "total_events": float(index % 7)}
+        record = SignalRecord(timestamp=_start() + dt.timedelta(seconds=index), values=values)
+        buffer.append(record)
+        appended.append(record)
+
+        kept = appended[-maxlen:]
+        cutoffs = [
+            kept[0].timestamp_ns - 1,
+            kept[-1].timestamp_ns + 1,
+            *(item.timestamp_ns for item in kept),
+        ]
+        for cutoff in cutoffs:
+            assert buffer.activity_since(cutoff) == _brute_force(kept, cutoff)
+
+    # 确认确实经历过至少一次整体裁剪
+    assert buffer._base > 0.0
+
+
+def test_activity_since_before_first_and_after_last() -> None:
+    buffer = SignalBuffer(maxlen=4)
+    records = [
+        SignalRecord(timestamp=_start() + dt.timedelta(seconds=i), values={"total_events": 2.0})
+        for i in range(3)
+    ]
+    for record in records:
+        buffer.append(record)
+
+    assert buffer.activity_since(records[0].timestamp_ns - 1) == 6.0
+    assert buffer.activity_since(records[-1].timestamp_ns) == 2.0
+    assert buffer.activity_since(records[-1].timestamp_ns + 1) == 0.0
+
+
+def test_clear_resets_cumulative_base() -> None:
+    maxlen = 3
+    buffer = SignalBuffer(maxlen=maxlen)
+    for index in range(maxlen * 2 + 1):
+        buffer.append(
+            SignalRecord(
+                timestamp=_start() + dt.timedelta(seconds=index),
+                values={"keyboard_mouse_activity": 5.0},
+            )
+        )
+    assert buffer._base > 0.0
+
+    buffer.clear()
+
+    assert buffer._base == 0.0
+    assert buffer._start == 0
+    assert buffer.activity_since(0) == 0.0
+
+    record = SignalRecord(timestamp=_start(), values={"keyboard_mouse_activity": 1.5})
+    buffer.append(record)
+    assert buffer.activity_since(record.timestamp_ns) == 1.5